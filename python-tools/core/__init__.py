@@ -2,10 +2,11 @@
 DevToolkit Core Module
 """
 
-from .base import BaseTool, ToolInput, ToolOutput, ToolConfig, ToolRegistry, registry
+from .base import BaseTool, DataclassInput, ToolInput, ToolOutput, ToolConfig, ToolRegistry, registry
 
 __all__ = [
     'BaseTool',
+    'DataclassInput',
     'ToolInput', 
     'ToolOutput',
     'ToolConfig',
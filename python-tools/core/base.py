@@ -3,53 +3,77 @@ Base Tool Classes and Interfaces
 Defines the foundation for all DevToolkit plugins
 """
 
+import dataclasses
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional, Type, Union, get_type_hints, cast
-from pydantic import BaseModel, Field
-
-# Pydantic v2 ConfigDict availability check
-_HAS_CONFIGDICT = False
-try:
-    # We test for availability but avoid calling ConfigDict at module import time
-    # to prevent static analysis (Pylance) from complaining about optional calls.
-    from pydantic import ConfigDict  # type: ignore
-    _HAS_CONFIGDICT = True
-except Exception:
-    # ConfigDict not available (older pydantic). We'll use the class-based Config fallback.
-    _HAS_CONFIGDICT = False
-import json
-
-# Default model_config values (plain dicts are acceptable to Pydantic v2)
-_DEFAULT_INPUT_MODEL_CONFIG = {"extra": "allow"}
-_DEFAULT_OUTPUT_MODEL_CONFIG = {"json_encoders": {}}
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple, Type, Union
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
 
 
 class ToolInput(BaseModel):
     """Base class for tool input validation"""
-    # Pydantic v2 configuration (set at definition time). Use plain dict to avoid
-    # calling ConfigDict (which some static checkers treat as optional).
-    if _HAS_CONFIGDICT:
-        # Cast to ConfigDict for static type-checkers while keeping a plain dict at runtime
-        model_config = cast("ConfigDict", _DEFAULT_INPUT_MODEL_CONFIG)
-    else:
-        class Config:
-            extra = "allow"
+    # Inputs, outputs and configs are never mutated after creation, so freeze them
+    model_config = ConfigDict(extra="allow", frozen=True)
+
+
+class DataclassInput:
+    """Base class for tool inputs declared as slotted dataclasses
+    
+    For small inputs that skip pydantic-core validation. Subclasses are
+    ``@dataclass(slots=True)`` classes that check their fields in
+    ``__post_init__`` and attach descriptions with ``Annotated[..., Field()]``;
+    this base supplies the ``model_validate`` / ``model_json_schema`` hooks
+    BaseTool calls on input models.
+    """
+    __slots__ = ()
+    # Read by pydantic when generating the schema, matching ToolInput's
+    __pydantic_config__ = ConfigDict(extra="allow")
+    
+    @classmethod
+    def model_validate(cls, data: Dict[str, Any]):
+        """Build an instance from a dict; unknown keys are ignored"""
+        kwargs = {}
+        for name, required in _dataclass_fields(cls):
+            if name in data:
+                kwargs[name] = data[name]
+            elif required:
+                raise ValueError(f"Field '{name}' is required")
+        return cls(**kwargs)
+    
+    @classmethod
+    def model_json_schema(cls) -> Dict[str, Any]:
+        """JSON schema of the dataclass (generated once per class)"""
+        return _dataclass_schema(cls)
+
+
+@lru_cache(maxsize=None)
+def _dataclass_fields(cls: type) -> Tuple[Tuple[str, bool], ...]:
+    """(name, required) for each init field of a dataclass"""
+    return tuple(
+        (f.name, f.default is dataclasses.MISSING and f.default_factory is dataclasses.MISSING)
+        for f in dataclasses.fields(cls) if f.init
+    )
+
+
+@lru_cache(maxsize=None)
+def _dataclass_schema(cls: type) -> Dict[str, Any]:
+    """Pydantic's JSON schema for a dataclass, shared between callers"""
+    return TypeAdapter(cls).json_schema()
 
 
 class ToolOutput(BaseModel):
-    """Base class for tool output structure"""
-    # Pydantic v2 configuration for JSON encoders
-    if _HAS_CONFIGDICT:
-        model_config = cast("ConfigDict", _DEFAULT_OUTPUT_MODEL_CONFIG)
-    else:
-        class Config:
-            json_encoders = {
-                # Add custom encoders if needed
-            }
+    """Base class for tool output structure
+    
+    Tools build their outputs with ``model_construct``: every field is a
+    value the tool just computed, so re-validating it would only cost time.
+    """
+    model_config = ConfigDict(frozen=True)
 
 
 class ToolConfig(BaseModel):
     """Configuration options for a tool"""
+    model_config = ConfigDict(frozen=True)
+    
     name: str = Field(description="Tool name")
     description: str = Field(description="Tool description")
     category: str = Field(description="Tool category")
@@ -59,10 +83,33 @@ class ToolConfig(BaseModel):
 
 
 class BaseTool(ABC):
-    """Abstract base class for all DevToolkit plugins"""
+    """Abstract base class for all DevToolkit plugins
+    
+    Concrete subclasses register themselves with the global registry when the
+    class is defined. Pass ``tool_name="..."`` in the class statement to pick
+    the registry name, or set ``_auto_register = False`` to opt out.
+    """
+    
+    _auto_register: bool = True
+    
+    def __init_subclass__(cls, tool_name: Optional[str] = None, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if not cls.__dict__.get('_auto_register', True):
+            return
+        # ABCMeta fills in __abstractmethods__ only after this hook runs, so
+        # check the abstract interface by hand to skip intermediate bases.
+        if any(getattr(getattr(cls, attr, None), '__isabstractmethod__', False)
+               for attr in BaseTool.__abstractmethods__):
+            return
+        registry.register_tool(cls, tool_name)
     
     def __init__(self):
         self._config = self.get_config()
+        # Model classes are fixed per tool; resolve them once instead of per run()
+        self._input_model = self.get_input_model()
+        self._output_model = self.get_output_model()
+        self._input_schema: Optional[Dict[str, Any]] = None
+        self._output_schema: Optional[Dict[str, Any]] = None
     
     @property
     def config(self) -> ToolConfig:
@@ -75,8 +122,8 @@ class BaseTool(ABC):
         pass
     
     @abstractmethod
-    def get_input_model(self) -> Type[ToolInput]:
-        """Return the Pydantic model for input validation"""
+    def get_input_model(self) -> Union[Type[ToolInput], Type[DataclassInput]]:
+        """Return the Pydantic model (or DataclassInput) for input validation"""
         pass
     
     @abstractmethod
@@ -90,17 +137,20 @@ class BaseTool(ABC):
         pass
     
     def get_input_schema(self) -> Dict[str, Any]:
-        """Get JSON schema for input validation"""
-        return self.get_input_model().model_json_schema()
+        """Get JSON schema for input validation (generated once per instance)"""
+        if self._input_schema is None:
+            self._input_schema = self._input_model.model_json_schema()
+        return self._input_schema
     
     def get_output_schema(self) -> Dict[str, Any]:
-        """Get JSON schema for output structure"""
-        return self.get_output_model().model_json_schema()
+        """Get JSON schema for output structure (generated once per instance)"""
+        if self._output_schema is None:
+            self._output_schema = self._output_model.model_json_schema()
+        return self._output_schema
     
-    def validate_input(self, data: Dict[str, Any]) -> ToolInput:
+    def validate_input(self, data: Dict[str, Any]) -> Union[ToolInput, DataclassInput]:
         """Validate and parse input data"""
-        input_model = self.get_input_model()
-        return input_model.model_validate(data)
+        return self._input_model.model_validate(data)
     
     def format_output(self, output: ToolOutput) -> Dict[str, Any]:
         """Format output as dictionary"""
@@ -108,16 +158,24 @@ class BaseTool(ABC):
     
     def run(self, input_data: Dict[str, Any]) -> Dict[str, Any]:
         """Complete workflow: validate input, execute, format output"""
+        # Validation and execution fail independently; keep them in separate
+        # blocks so each stage's errors are reported from that stage only.
         try:
             validated_input = self.validate_input(input_data)
-            result = self.execute(validated_input)
-            return self.format_output(result)
         except Exception as e:
-            return {
-                "error": str(e),
-                "type": type(e).__name__,
-                "tool": self.config.name
-            }
+            return self._error_response(e)
+        try:
+            return self.format_output(self.execute(validated_input))
+        except Exception as e:
+            return self._error_response(e)
+    
+    def _error_response(self, error: Exception) -> Dict[str, Any]:
+        """Build the error dict returned by run()"""
+        return {
+            "error": str(error),
+            "type": type(error).__name__,
+            "tool": self._config.name
+        }
 
 
 class ToolRegistry:
@@ -125,6 +183,12 @@ class ToolRegistry:
     
     def __init__(self):
         self._tools: Dict[str, Type[BaseTool]] = {}
+        # Tools are stateless, so one shared instance per name is enough
+        self._instances: Dict[str, BaseTool] = {}
+        # Inverted index: category -> tool names, in registration order
+        self._by_category: Dict[str, List[str]] = {}
+        # Cached snapshot() result, rebuilt after the next registration
+        self._list_cache: Optional[Dict[str, Any]] = None
     
     def register_tool(self, cls: Type[BaseTool], name: Optional[str] = None) -> None:
         """Register a tool class"""
@@ -138,16 +202,22 @@ class ToolRegistry:
         if not issubclass(cls, BaseTool):
             raise ValueError(f"Tool '{name}' must inherit from BaseTool")
         
+        tool = cls()
         self._tools[name] = cls
+        self._instances[name] = tool
+        self._by_category.setdefault(tool.config.category, []).append(name)
+        self._list_cache = None
         # Silent registration - no output to avoid interfering with JSON responses
     
     def get_tool(self, name: str) -> BaseTool:
-        """Get an instance of a tool"""
-        tool_class = self._tools.get(name)
-        if tool_class is None:
-            raise ValueError(f"Tool '{name}' not found")
-        
-        return tool_class()
+        """Get the shared instance of a tool (created at registration)"""
+        tool = self._instances.get(name)
+        if tool is None:
+            tool_class = self._tools.get(name)
+            if tool_class is None:
+                raise ValueError(f"Tool '{name}' not found")
+            tool = self._instances[name] = tool_class()
+        return tool
     
     def list_tools(self) -> List[str]:
         """List all registered tool names"""
@@ -165,20 +235,29 @@ class ToolRegistry:
     
     def get_tools_by_category(self, category: str) -> List[str]:
         """Get tools filtered by category"""
-        tools = []
-        for name in self.list_tools():
-            tool = self.get_tool(name)
-            if tool.config.category == category:
-                tools.append(name)
-        return tools
+        return list(self._by_category.get(category, ()))
     
     def get_all_categories(self) -> List[str]:
         """Get all unique categories"""
-        categories = set()
-        for name in self.list_tools():
-            tool = self.get_tool(name)
-            categories.add(tool.config.category)
-        return sorted(list(categories))
+        return sorted(self._by_category)
+    
+    def snapshot(self) -> Dict[str, Any]:
+        """Get a summary of all registered tools (cached until the next registration)
+        
+        The returned dict is shared between callers; treat it as read-only.
+        """
+        if self._list_cache is None:
+            categories = self.get_all_categories()
+            self._list_cache = {
+                "total_tools": len(self._tools),
+                "categories": categories,
+                "tools": self.list_tools(),
+                "tools_by_category": {
+                    category: self.get_tools_by_category(category)
+                    for category in categories
+                },
+            }
+        return self._list_cache
 
 
 # Global registry instance
@@ -4,26 +4,35 @@ DevToolkit - Plugin-Based Developer Utilities
 A modular collection of developer tools with Pydantic validation
 """
 
+import os
 import sys
 import json
 import argparse
-from typing import Any, Dict, List
-from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
 
-# Add current directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent))
+# Add current directory to path for imports (os.path: pathlib costs ~4ms to import)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-# Import core components
-from core import registry
-# Import all plugins (triggers registration)
-import plugins
+import jsonio
+
+
+def _load_registry(tool_name: Optional[str] = None):
+    """Import the plugins a command needs and return the tool registry
+    
+    Core (pydantic) and plugin imports are deferred to here so `--help` and
+    argument errors don't pay for them, and a single-tool command only
+    imports that tool's plugin.
+    """
+    from core import registry
+    import plugins
+    if tool_name is None or not plugins.load_plugin(tool_name):
+        # Listing, or an unknown name: load everything so errors can list all tools
+        plugins.load_all()
+    return registry
 
 def output_json(data: Any, pretty: bool = True) -> None:
     """Output JSON to stdout"""
-    if pretty:
-        print(json.dumps(data, indent=2, ensure_ascii=False))
-    else:
-        print(json.dumps(data, ensure_ascii=False))
+    jsonio.write(data, pretty)
 
 def output_error(message: str, code: int = 1) -> None:
     """Output error message to stderr and exit"""
@@ -32,22 +41,11 @@ def output_error(message: str, code: int = 1) -> None:
 
 def list_tools_command() -> Dict[str, Any]:
     """List all available tools"""
-    tools = registry.list_tools()
-    categories = registry.get_all_categories()
-    
-    tools_by_category = {}
-    for category in categories:
-        tools_by_category[category] = registry.get_tools_by_category(category)
-    
-    return {
-        "total_tools": len(tools),
-        "categories": categories,
-        "tools": tools,
-        "tools_by_category": tools_by_category
-    }
+    return _load_registry().snapshot()
 
 def tool_info_command(tool_name: str) -> Dict[str, Any]:
     """Get detailed information about a specific tool"""
+    registry = _load_registry(tool_name)
     try:
         return registry.get_tool_info(tool_name)
     except ValueError as e:
@@ -55,12 +53,95 @@ def tool_info_command(tool_name: str) -> Dict[str, Any]:
 
 def execute_tool_command(tool_name: str, input_data: Dict[str, Any]) -> Dict[str, Any]:
     """Execute a tool with given input data"""
+    registry = _load_registry(tool_name)
     try:
         tool = registry.get_tool(tool_name)
         return tool.run(input_data)
     except ValueError as e:
         raise ValueError(f"Tool '{tool_name}' not found. Available tools: {', '.join(registry.list_tools())}")
 
+def _cmd_list(args: argparse.Namespace) -> Dict[str, Any]:
+    return list_tools_command()
+
+def _cmd_info(args: argparse.Namespace) -> Dict[str, Any]:
+    return tool_info_command(args.tool)
+
+def _cmd_run(args: argparse.Namespace) -> Dict[str, Any]:
+    try:
+        input_data = json.loads(args.input)
+    except json.JSONDecodeError as e:
+        raise ValueError(f"Invalid JSON input: {e}")
+    return execute_tool_command(args.tool, input_data)
+
+# Legacy command support
+
+def _cmd_base64(args: argparse.Namespace) -> Dict[str, Any]:
+    return execute_tool_command('base64', {
+        "text": args.text,
+        "operation": "decode" if args.decode else "encode"
+    })
+
+def _cmd_url(args: argparse.Namespace) -> Dict[str, Any]:
+    return execute_tool_command('url', {
+        "text": args.text,
+        "operation": "decode" if args.decode else "encode"
+    })
+
+def _cmd_hash(args: argparse.Namespace) -> Dict[str, Any]:
+    return execute_tool_command('hash', {
+        "text": args.text,
+        "algorithm": args.algorithm
+    })
+
+def _cmd_jwt(args: argparse.Namespace) -> Dict[str, Any]:
+    return execute_tool_command('jwt', {
+        "token": args.token
+    })
+
+def _cmd_json(args: argparse.Namespace) -> Dict[str, Any]:
+    # If caller passes '-' as the text argument, read the JSON payload from stdin.
+    text_value = args.text
+    if text_value == '-':
+        try:
+            text_value = sys.stdin.read()
+        except Exception:
+            raise ValueError("Failed to read JSON from stdin")
+    return execute_tool_command('json', {
+        "text": text_value,
+        "minify": args.minify
+    })
+
+def _cmd_uuid(args: argparse.Namespace) -> Dict[str, Any]:
+    return execute_tool_command('uuid', {
+        "version": args.version,
+        "count": args.count
+    })
+
+def _cmd_epoch(args: argparse.Namespace) -> Dict[str, Any]:
+    return execute_tool_command('epoch', {
+        "timestamp": args.timestamp
+    })
+
+def _cmd_color(args: argparse.Namespace) -> Dict[str, Any]:
+    return execute_tool_command('color', {
+        "color": args.color
+    })
+
+# Subcommand name -> handler taking the parsed args and returning the result dict
+_DISPATCH: Dict[str, Callable[[argparse.Namespace], Dict[str, Any]]] = {
+    'list': _cmd_list,
+    'info': _cmd_info,
+    'run': _cmd_run,
+    'base64': _cmd_base64,
+    'url': _cmd_url,
+    'hash': _cmd_hash,
+    'jwt': _cmd_jwt,
+    'json': _cmd_json,
+    'uuid': _cmd_uuid,
+    'epoch': _cmd_epoch,
+    'color': _cmd_color,
+}
+
 def main():
     """Main CLI entry point"""
     parser = argparse.ArgumentParser(
@@ -129,80 +210,13 @@ Examples:
     
     args = parser.parse_args()
     
-    if not args.command:
+    handler = _DISPATCH.get(args.command)
+    if handler is None:
         parser.print_help()
         return 1
     
     try:
-        if args.command == 'list':
-            result = list_tools_command()
-        elif args.command == 'info':
-            result = tool_info_command(args.tool)
-        elif args.command == 'run':
-            try:
-                input_data = json.loads(args.input)
-            except json.JSONDecodeError as e:
-                raise ValueError(f"Invalid JSON input: {e}")
-            result = execute_tool_command(args.tool, input_data)
-        
-        # Legacy command support
-        elif args.command == 'base64':
-            input_data = {
-                "text": args.text,
-                "operation": "decode" if args.decode else "encode"
-            }
-            result = execute_tool_command('base64', input_data)
-        elif args.command == 'url':
-            input_data = {
-                "text": args.text,
-                "operation": "decode" if args.decode else "encode"
-            }
-            result = execute_tool_command('url', input_data)
-        elif args.command == 'hash':
-            input_data = {
-                "text": args.text,
-                "algorithm": args.algorithm
-            }
-            result = execute_tool_command('hash', input_data)
-        elif args.command == 'jwt':
-            input_data = {
-                "token": args.token
-            }
-            result = execute_tool_command('jwt', input_data)
-        elif args.command == 'json':
-            # If caller passes '-' as the text argument, read the JSON payload from stdin.
-            text_value = args.text
-            if text_value == '-':
-                try:
-                    text_value = sys.stdin.read()
-                except Exception:
-                    raise ValueError("Failed to read JSON from stdin")
-
-            input_data = {
-                "text": text_value,
-                "minify": args.minify
-            }
-            result = execute_tool_command('json', input_data)
-        elif args.command == 'uuid':
-            input_data = {
-                "version": args.version,
-                "count": args.count
-            }
-            result = execute_tool_command('uuid', input_data)
-        elif args.command == 'epoch':
-            input_data = {
-                "timestamp": args.timestamp
-            }
-            result = execute_tool_command('epoch', input_data)
-        elif args.command == 'color':
-            input_data = {
-                "color": args.color
-            }
-            result = execute_tool_command('color', input_data)
-        else:
-            parser.print_help()
-            return 1
-        
+        result = handler(args)
         output_json(result)
         return 0
     
@@ -5,19 +5,81 @@ A collection of developer utilities that can be called from Raycast commands.
 """
 
 from __future__ import annotations
-import argparse
+import hashlib
 import json
+import os
 import sys
 import time
+from datetime import datetime, timezone
+from functools import lru_cache
+from types import SimpleNamespace
 from typing import Any, Dict, List, Optional, Union
+from urllib.parse import quote, unquote
+
+import jsonio
+
+# Prefer the SIMD-accelerated pybase64 when installed; it mirrors the stdlib API.
+try:
+    import pybase64 as _b64
+except ImportError:
+    import base64 as _b64
+
+try:
+    import blake3 as _blake3
+except ImportError:
+    _blake3 = None
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# strftime formats used by epoch_converter and jwt_decoder
+_FMT_READABLE = "%a, %d %b %Y %H:%M:%S %Z"
+_FMT_DMY = "%d/%m/%Y %H:%M:%S"
+_FMT_JWT_UTC = "%Y-%m-%d %H:%M:%S UTC"
+
+
+def _uuid4_batch(count: int) -> List[str]:
+    """Generate ``count`` random (v4) UUID strings from a single urandom read."""
+    buf = bytearray(os.urandom(16 * count))
+    uuids = []
+    for i in range(0, 16 * count, 16):
+        buf[i + 6] = (buf[i + 6] & 0x0f) | 0x40  # version 4
+        buf[i + 8] = (buf[i + 8] & 0x3f) | 0x80  # RFC 4122 variant
+        h = buf[i:i + 16].hex()
+        uuids.append(f"{h[0:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:32]}")
+    return uuids
+
+
+def _json_loads(text: Union[str, bytes], lossless: bool = False) -> Any:
+    """Parse JSON, using msgspec or orjson when available.
+    
+    ``lossless`` skips orjson, which turns integers wider than 64 bits into
+    floats; msgspec and the stdlib keep them exact.
+    """
+    if msgspec is not None:
+        try:
+            return msgspec.json.decode(text)
+        except msgspec.DecodeError:
+            # Let the stdlib decide so error messages stay the same
+            pass
+    elif orjson is not None and not lossless:
+        try:
+            return orjson.loads(text)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(text)
 
 
 def output_json(data: Any, pretty: bool = True) -> None:
     """Output JSON to stdout for consumption by Raycast."""
-    if pretty:
-        print(json.dumps(data, indent=2, ensure_ascii=False))
-    else:
-        print(json.dumps(data, ensure_ascii=False))
+    jsonio.write(data, pretty)
 
 
 def output_error(message: str, code: int = 1) -> None:
@@ -26,14 +88,23 @@ def output_error(message: str, code: int = 1) -> None:
     sys.exit(code)
 
 
+@lru_cache(maxsize=128)
+def _hex_to_rgb(hex_color: str) -> tuple:
+    """Convert a #RRGGBB string to an (r, g, b) tuple."""
+    hex_color = hex_color.lstrip('#')
+    # isalnum() keeps int() from accepting signs, spaces or '_' separators
+    if len(hex_color) != 6 or not hex_color.isalnum():
+        raise ValueError("Invalid hex color format")
+    v = int(hex_color, 16)
+    return (v >> 16) & 0xff, (v >> 8) & 0xff, v & 0xff
+
+
 class DevTools:
     """Collection of developer utility functions."""
     
     @staticmethod
     def epoch_converter(epoch_input: str = None) -> Dict[str, Any]:
         """Convert epoch timestamp to human-readable formats."""
-        from datetime import datetime, timezone
-        
         if epoch_input is None:
             epoch = int(time.time())
         else:
@@ -49,24 +120,35 @@ class DevTools:
         
         # Convert to datetime objects
         dt_utc = datetime.fromtimestamp(epoch, tz=timezone.utc)
+        utc = {
+            "readable": dt_utc.strftime(_FMT_READABLE),
+            # Fixed layout for whole-second UTC times; cheaper than isoformat()
+            "iso": f"{dt_utc.year:04d}-{dt_utc.month:02d}-{dt_utc.day:02d}T"
+                   f"{dt_utc.hour:02d}:{dt_utc.minute:02d}:{dt_utc.second:02d}+00:00",
+            "ddmmyyyy": dt_utc.strftime(_FMT_DMY)
+        }
+        
+        # astimezone() runs on every call; when the local zone is UTC at that
+        # instant the local view is identical, so only the formatting is skipped
         dt_local = dt_utc.astimezone()
+        if not dt_local.utcoffset() and dt_local.tzname() == "UTC":
+            # Share the dict rather than copying it; the result is only read
+            # (and serialized) by callers.
+            local = utc
+        else:
+            local = {
+                "readable": dt_local.strftime(_FMT_READABLE),
+                "iso": dt_local.isoformat(),
+                "ddmmyyyy": dt_local.strftime(_FMT_DMY)
+            }
         
         # Calculate relative time
-        now = datetime.now(timezone.utc)
-        diff = now - dt_utc
+        diff = datetime.now(timezone.utc) - dt_utc
         
         return {
             "epoch": epoch,
-            "utc": {
-                "readable": dt_utc.strftime("%a, %d %b %Y %H:%M:%S %Z"),
-                "iso": dt_utc.isoformat(),
-                "ddmmyyyy": dt_utc.strftime("%d/%m/%Y %H:%M:%S")
-            },
-            "local": {
-                "readable": dt_local.strftime("%a, %d %b %Y %H:%M:%S %Z"),
-                "iso": dt_local.isoformat(),
-                "ddmmyyyy": dt_local.strftime("%d/%m/%Y %H:%M:%S")
-            },
+            "utc": utc,
+            "local": local,
             "relative": {
                 "days": diff.days,
                 "seconds": int(diff.total_seconds()),
@@ -77,10 +159,6 @@ class DevTools:
     @staticmethod
     def jwt_decoder(token: str) -> Dict[str, Any]:
         """Decode JWT token without verification."""
-        import base64
-        import json
-        from datetime import datetime
-        
         try:
             # Split the token
             header_b64, payload_b64, signature_b64 = token.split('.')
@@ -89,8 +167,8 @@ class DevTools:
             def decode_b64url(data: str) -> dict:
                 # Add padding if needed
                 padding = '=' * (-len(data) % 4)
-                decoded = base64.urlsafe_b64decode(data + padding)
-                return json.loads(decoded)
+                decoded = _b64.urlsafe_b64decode(data + padding)
+                return _json_loads(decoded)
             
             header = decode_b64url(header_b64)
             payload = decode_b64url(payload_b64)
@@ -99,17 +177,23 @@ class DevTools:
             issued_at = payload.get('iat')
             expires_at = payload.get('exp')
             
+            # The decoded signature length follows from the encoded length alone
+            sig_chars = len(signature_b64.rstrip('='))
+            sig_rem = sig_chars & 3
+            if sig_rem == 1:
+                raise ValueError("Invalid base64url signature length")
+            
             result = {
                 "header": header,
                 "payload": payload,
-                "signature_length": len(base64.urlsafe_b64decode(signature_b64 + '=='))
+                "signature_length": (sig_chars >> 2) * 3 + (sig_rem - 1 if sig_rem else 0)
             }
             
             # Add human-readable times
             if issued_at:
-                result["issued_at_readable"] = datetime.fromtimestamp(issued_at).strftime("%Y-%m-%d %H:%M:%S UTC")
+                result["issued_at_readable"] = time.strftime(_FMT_JWT_UTC, time.gmtime(issued_at))
             if expires_at:
-                result["expires_at_readable"] = datetime.fromtimestamp(expires_at).strftime("%Y-%m-%d %H:%M:%S UTC")
+                result["expires_at_readable"] = time.strftime(_FMT_JWT_UTC, time.gmtime(expires_at))
                 now = time.time()
                 result["is_expired"] = expires_at < now
                 result["expires_in_seconds"] = max(0, expires_at - now)
@@ -122,8 +206,6 @@ class DevTools:
     @staticmethod
     def url_encoder(text: str, decode: bool = False) -> Dict[str, str]:
         """URL encode or decode text."""
-        from urllib.parse import quote, unquote
-        
         if decode:
             return {
                 "input": text,
@@ -140,18 +222,16 @@ class DevTools:
     @staticmethod
     def base64_converter(text: str, decode: bool = False) -> Dict[str, str]:
         """Base64 encode or decode text."""
-        import base64
-        
         try:
             if decode:
-                decoded = base64.b64decode(text).decode('utf-8')
+                decoded = _b64.b64decode(text, validate=True).decode('utf-8')
                 return {
                     "input": text,
                     "output": decoded,
                     "operation": "decode"
                 }
             else:
-                encoded = base64.b64encode(text.encode('utf-8')).decode('utf-8')
+                encoded = _b64.b64encode(text.encode('utf-8')).decode('utf-8')
                 return {
                     "input": text,
                     "output": encoded,
@@ -163,20 +243,24 @@ class DevTools:
     @staticmethod
     def hash_generator(text: str, algorithm: str = "sha256") -> Dict[str, str]:
         """Generate hash of text using specified algorithm."""
-        import hashlib
-        
         algorithms = {
-            "md5": hashlib.md5,
-            "sha1": hashlib.sha1,
+            # md5/sha1 are offered for checksums only; flag them as such so
+            # hashlib can use the fastest OpenSSL-backed implementation.
+            "md5": lambda: hashlib.new("md5", usedforsecurity=False),
+            "sha1": lambda: hashlib.new("sha1", usedforsecurity=False),
             "sha256": hashlib.sha256,
             "sha512": hashlib.sha512
         }
+        if _blake3 is not None:
+            algorithms["blake3"] = _blake3.blake3
         
         if algorithm not in algorithms:
+            if algorithm == "blake3":
+                raise ValueError("blake3 requires the 'blake3' package to be installed")
             raise ValueError(f"Unsupported algorithm: {algorithm}")
         
         hash_func = algorithms[algorithm]()
-        hash_func.update(text.encode('utf-8'))
+        hash_func.update(memoryview(text.encode('utf-8')))
         
         return {
             "input": text,
@@ -188,11 +272,10 @@ class DevTools:
     def json_formatter(text: str, minify: bool = False) -> Dict[str, Any]:
         """Format JSON text (pretty print or minify)."""
         try:
-            parsed = json.loads(text)
-            if minify:
-                formatted = json.dumps(parsed, separators=(',', ':'))
-            else:
-                formatted = json.dumps(parsed, indent=2, ensure_ascii=False)
+            # A formatter must not round wide integers, hence lossless, nor
+            # respell the user's numbers, hence the stdlib encoder
+            parsed = _json_loads(text, lossless=True)
+            formatted = jsonio.dumps_stdlib(parsed, pretty=not minify)
             
             return {
                 "input": text,
@@ -210,18 +293,15 @@ class DevTools:
     @staticmethod
     def uuid_generator(version: int = 4, count: int = 1) -> Dict[str, Any]:
         """Generate UUID(s)."""
-        import uuid
-        
-        generators = {
-            1: uuid.uuid1,
-            4: uuid.uuid4
-        }
-        
-        if version not in generators:
+        if version == 4:
+            uuids = _uuid4_batch(count)
+        elif version == 1:
+            # uuid pulls in platform & co.; only the v1 path needs it
+            import uuid
+            uuids = [str(uuid.uuid1()) for _ in range(count)]
+        else:
             raise ValueError(f"Unsupported UUID version: {version}")
         
-        uuids = [str(generators[version]()) for _ in range(count)]
-        
         return {
             "version": version,
             "count": count,
@@ -231,9 +311,18 @@ class DevTools:
     @staticmethod
     def color_converter(color: str, output_format: str = "all") -> Dict[str, Any]:
         """Convert color between different formats."""
-        def hex_to_rgb(hex_color: str) -> tuple:
-            hex_color = hex_color.lstrip('#')
-            return tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
+        def parse_rgb(rgb_color: str) -> tuple:
+            try:
+                inner = rgb_color[rgb_color.index('(') + 1:rgb_color.rindex(')')]
+                parts = inner.split(',')
+                if len(parts) != 3:
+                    raise ValueError
+                r, g, b = int(parts[0]), int(parts[1]), int(parts[2])
+            except ValueError:
+                raise ValueError("Invalid RGB format")
+            if not (0 <= r <= 255 and 0 <= g <= 255 and 0 <= b <= 255):
+                raise ValueError("RGB values must be between 0 and 255")
+            return r, g, b
         
         def rgb_to_hex(r: int, g: int, b: int) -> str:
             return f"#{r:02x}{g:02x}{b:02x}"
@@ -253,13 +342,13 @@ class DevTools:
                 # Saturation
                 s = diff / (2 - max_val - min_val) if l > 0.5 else diff / (max_val + min_val)
                 
-                # Hue
-                if max_val == r:
-                    h = ((g - b) / diff + (6 if g < b else 0)) / 6
-                elif max_val == g:
-                    h = ((b - r) / diff + 2) / 6
-                else:
-                    h = ((r - g) / diff + 4) / 6
+                # Hue: compute the candidate for each dominant channel and pick by index
+                hues = (
+                    ((g - b) / diff + (6 if g < b else 0)) / 6,
+                    ((b - r) / diff + 2) / 6,
+                    ((r - g) / diff + 4) / 6,
+                )
+                h = hues[0 if max_val == r else (1 if max_val == g else 2)]
             
             return int(h * 360), int(s * 100), int(l * 100)
         
@@ -267,17 +356,12 @@ class DevTools:
             # Determine input format and convert
             if color.startswith('#'):
                 # HEX input
-                r, g, b = hex_to_rgb(color)
+                r, g, b = _hex_to_rgb(color)
                 h, s, l = rgb_to_hsl(r, g, b)
             elif color.startswith('rgb'):
                 # RGB input
-                import re
-                match = re.search(r'rgb\((\d+),\s*(\d+),\s*(\d+)\)', color)
-                if match:
-                    r, g, b = map(int, match.groups())
-                    h, s, l = rgb_to_hsl(r, g, b)
-                else:
-                    raise ValueError("Invalid RGB format")
+                r, g, b = parse_rgb(color)
+                h, s, l = rgb_to_hsl(r, g, b)
             else:
                 raise ValueError("Unsupported color format")
             
@@ -312,8 +396,84 @@ class DevTools:
             return f"{seconds // 86400} days ago"
 
 
-def main():
-    """CLI entry point."""
+# CLI command -> handler taking the parsed argparse namespace
+COMMANDS = {
+    'epoch': lambda args: DevTools.epoch_converter(args.timestamp),
+    'jwt': lambda args: DevTools.jwt_decoder(args.token),
+    'url': lambda args: DevTools.url_encoder(args.text, args.decode),
+    'base64': lambda args: DevTools.base64_converter(args.text, args.decode),
+    'hash': lambda args: DevTools.hash_generator(args.text, args.algorithm),
+    'json': lambda args: DevTools.json_formatter(args.text, args.minify),
+    'uuid': lambda args: DevTools.uuid_generator(args.version, args.count),
+    'color': lambda args: DevTools.color_converter(args.color),
+}
+
+
+# Argument layout per command for the argparse-free fast path:
+# (positionals, number of required positionals, store_true flags, options)
+# where options map --name -> (dest, type, choices, default).
+_FAST_ARGS = {
+    'epoch': (('timestamp',), 0, {}, {}),
+    'jwt': (('token',), 1, {}, {}),
+    'url': (('text',), 1, {'--decode': 'decode'}, {}),
+    'base64': (('text',), 1, {'--decode': 'decode'}, {}),
+    'hash': (('text',), 1, {}, {
+        '--algorithm': ('algorithm', str, ('md5', 'sha1', 'sha256', 'sha512', 'blake3'), 'sha256'),
+    }),
+    'json': (('text',), 1, {'--minify': 'minify'}, {}),
+    'uuid': ((), 0, {}, {
+        '--version': ('version', int, (1, 4), 4),
+        '--count': ('count', int, None, 1),
+    }),
+    'color': (('color',), 1, {}, {}),
+}
+
+
+def _parse_args_fast(argv: List[str]) -> Optional[SimpleNamespace]:
+    """Parse the common command lines without importing argparse.
+    
+    Returns None for anything unusual (help, unknown or malformed options,
+    wrong arity) so the caller can fall back to argparse for full handling
+    and error messages.
+    """
+    if not argv or argv[0] not in _FAST_ARGS:
+        return None
+    positionals, required, flags, options = _FAST_ARGS[argv[0]]
+    values: Dict[str, Any] = {name: None for name in positionals}
+    values.update({dest: False for dest in flags.values()})
+    values.update({dest: default for dest, _, _, default in options.values()})
+    
+    seen = 0
+    tokens = iter(argv[1:])
+    for token in tokens:
+        if token.startswith('-') and token != '-':
+            if token in flags:
+                values[flags[token]] = True
+            elif token in options:
+                dest, conv, choices, _ = options[token]
+                try:
+                    value = conv(next(tokens))
+                except (StopIteration, ValueError):
+                    return None
+                if choices is not None and value not in choices:
+                    return None
+                values[dest] = value
+            else:
+                return None
+        elif seen < len(positionals):
+            values[positionals[seen]] = token
+            seen += 1
+        else:
+            return None
+    if seen < required:
+        return None
+    return SimpleNamespace(command=argv[0], **values)
+
+
+def _build_parser():
+    """Build the full argparse CLI (help output, error reporting)."""
+    import argparse
+    
     parser = argparse.ArgumentParser(description="DevToolkit Python Helpers")
     subparsers = parser.add_subparsers(dest='command', help='Available commands')
     
@@ -338,7 +498,7 @@ def main():
     # Hash generator
     hash_parser = subparsers.add_parser('hash', help='Generate hash')
     hash_parser.add_argument('text', help='Text to hash')
-    hash_parser.add_argument('--algorithm', choices=['md5', 'sha1', 'sha256', 'sha512'], default='sha256', help='Hash algorithm')
+    hash_parser.add_argument('--algorithm', choices=['md5', 'sha1', 'sha256', 'sha512', 'blake3'], default='sha256', help='Hash algorithm')
     
     # JSON formatter
     json_parser = subparsers.add_parser('json', help='Format JSON')
@@ -354,30 +514,22 @@ def main():
     color_parser = subparsers.add_parser('color', help='Convert color formats')
     color_parser.add_argument('color', help='Color to convert (hex or rgb format)')
     
-    args = parser.parse_args()
-    
-    if not args.command:
-        parser.print_help()
-        return 1
+    return parser
+
+
+def main():
+    """CLI entry point."""
+    argv = sys.argv[1:]
+    args = _parse_args_fast(argv)
+    if args is None:
+        parser = _build_parser()
+        args = parser.parse_args(argv)
+        if not args.command:
+            parser.print_help()
+            return 1
     
     try:
-        if args.command == 'epoch':
-            result = DevTools.epoch_converter(args.timestamp)
-        elif args.command == 'jwt':
-            result = DevTools.jwt_decoder(args.token)
-        elif args.command == 'url':
-            result = DevTools.url_encoder(args.text, args.decode)
-        elif args.command == 'base64':
-            result = DevTools.base64_converter(args.text, args.decode)
-        elif args.command == 'hash':
-            result = DevTools.hash_generator(args.text, args.algorithm)
-        elif args.command == 'json':
-            result = DevTools.json_formatter(args.text, args.minify)
-        elif args.command == 'uuid':
-            result = DevTools.uuid_generator(args.version, args.count)
-        elif args.command == 'color':
-            result = DevTools.color_converter(args.color)
-        
+        result = COMMANDS[args.command](args)
         output_json(result)
         return 0
     
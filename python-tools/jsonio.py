@@ -0,0 +1,157 @@
+"""
+JSON Output Helpers
+Serialization and stdout writing shared by devtools.py and devtools_old.py
+"""
+
+import json
+import sys
+from json.encoder import encode_basestring as _encode_basestring
+from typing import Any, Optional
+
+# Stdlib fallback encoders, built once. The ASCII pair is for text that can't
+# be written as UTF-8, see dumps_stdlib.
+_ENCODER_PRETTY = json.JSONEncoder(indent=2, ensure_ascii=False)
+_ENCODER_COMPACT = json.JSONEncoder(separators=(',', ':'), ensure_ascii=False)
+_ENCODER_PRETTY_ASCII = json.JSONEncoder(indent=2)
+_ENCODER_COMPACT_ASCII = json.JSONEncoder(separators=(',', ':'))
+
+
+def _encode_scalar(value: Any) -> Optional[str]:
+    """JSON text for a str/int/bool value, or None for anything else."""
+    if isinstance(value, str):
+        return _encode_basestring(value)
+    if value is True:
+        return 'true'
+    if value is False:
+        return 'false'
+    if type(value) is int:
+        return str(value)
+    return None
+
+
+def _encode_shallow_pretty(data: Any) -> Optional[str]:
+    """Indent-2 JSON for flat results (uuid, hash, url, base64 commands).
+
+    Handles a dict whose values are str/int/bool or lists of those, producing
+    the same text as json.dumps(indent=2, ensure_ascii=False) without the
+    stdlib's pure-Python indenting encoder. Returns None for other shapes.
+    """
+    if type(data) is not dict:
+        return None
+    lines = []
+    for key, value in data.items():
+        if type(key) is not str:
+            return None
+        if type(value) is list:
+            items = [_encode_scalar(item) for item in value]
+            if None in items:
+                return None
+            text = '[\n    ' + ',\n    '.join(items) + '\n  ]' if items else '[]'
+        else:
+            text = _encode_scalar(value)
+            if text is None:
+                return None
+        lines.append(f'  {_encode_basestring(key)}: {text}')
+    if not lines:
+        return '{}'
+    return '{\n' + ',\n'.join(lines) + '\n}'
+
+
+def _dumpb_accelerated(data: Any, pretty: bool) -> Optional[bytes]:
+    """Serialize with msgspec, then orjson; None if neither is installed or both refuse.
+
+    Imported here rather than at module level: only the output path needs
+    them, so `--help` and argument errors don't pay for loading them.
+    """
+    try:
+        import msgspec
+    except ImportError:
+        pass
+    else:
+        try:
+            buf = msgspec.json.encode(data)
+            return msgspec.json.format(buf, indent=2) if pretty else buf
+        except (TypeError, UnicodeEncodeError, msgspec.EncodeError):
+            pass
+    try:
+        import orjson
+    except ImportError:
+        return None
+    option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if pretty else 0)
+    try:
+        return orjson.dumps(data, option=option)
+    except TypeError:
+        # Unsupported by orjson (e.g. integers wider than 64 bits, lone surrogates)
+        return None
+
+
+def _has_nonfinite(data: Any) -> bool:
+    """Whether a JSON tree holds NaN or +/-Infinity anywhere in its values."""
+    stack = [data]
+    while stack:
+        value = stack.pop()
+        kind = type(value)
+        if kind is dict:
+            stack.extend(value.values())
+        elif kind is list or kind is tuple:
+            stack.extend(value)
+        elif kind is float and value - value != 0.0:  # inf - inf and nan - nan are nan
+            return True
+    return False
+
+
+def dumps_stdlib(data: Any, pretty: bool = True) -> str:
+    """Serialize with the stdlib encoder, keeping the text encodable as UTF-8.
+
+    Non-ASCII characters are written as-is, except when the data holds lone
+    surrogates (valid JSON as escapes like \\ud800, but with no UTF-8 form):
+    then the whole text is ASCII-escaped, as json.dumps does by default.
+    """
+    text = _encode_shallow_pretty(data) if pretty else None
+    if text is None:
+        text = (_ENCODER_PRETTY if pretty else _ENCODER_COMPACT).encode(data)
+    if not text.isascii():
+        try:
+            text.encode('utf-8')
+        except UnicodeEncodeError:
+            text = (_ENCODER_PRETTY_ASCII if pretty else _ENCODER_COMPACT_ASCII).encode(data)
+    return text
+
+
+def dumpb(data: Any, pretty: bool = True) -> bytes:
+    """Serialize to UTF-8 JSON (2-space indent or compact).
+
+    Prefers msgspec, then orjson, then the stdlib encoder (dumps_stdlib). The
+    accelerators don't reproduce the stdlib's float spelling (they write 1e-7
+    and 1e20 for 1e-07 and 1e+20), so callers that must keep it, like a
+    formatter, use dumps_stdlib directly.
+
+    The accelerators write NaN/Infinity as null. Strictly parsed data never
+    holds them, but stdlib-parsed data can (e.g. a JWT payload with NaN, or
+    1e400, which overflows to inf), and command results don't say how their
+    parts were parsed; so a tree holding them is written by the stdlib.
+    """
+    buf = _dumpb_accelerated(data, pretty)
+    # Lost values show up as null, so only then is the tree worth walking
+    if buf is not None and (b'null' not in buf or not _has_nonfinite(data)):
+        return buf
+    return dumps_stdlib(data, pretty).encode('utf-8')
+
+
+def dumps(data: Any, pretty: bool = True) -> str:
+    """Serialize to JSON text, see dumpb."""
+    return dumpb(data, pretty).decode('utf-8')
+
+
+def write(data: Any, pretty: bool = True) -> None:
+    """Write data to stdout as one line-terminated JSON document."""
+    buf = dumpb(data, pretty) + b'\n'
+    out = getattr(sys.stdout, 'buffer', None)
+    if out is None:
+        # stdout replaced by a text-only stream (e.g. under test capture)
+        sys.stdout.write(buf.decode('utf-8'))
+        return
+    # Write the encoded bytes directly, skipping the TextIOWrapper layer
+    sys.stdout.flush()
+    out.write(buf)
+    out.flush()
@@ -1,18 +1,13 @@
 """
 DevToolkit Plugins
-Auto-import all available plugins
+Bundled plugin modules, imported on demand
+
+Importing a plugin module registers its tool with the global registry.
+Modules are loaded lazily (PEP 562) so a CLI call only pays for the tools
+it actually uses; call `load_all()` when every tool is needed.
 """
 
-# Import all plugin modules to trigger registration
-from . import base64_tool
-from . import url_tool
-from . import hash_tool
-from . import jwt_tool
-from . import json_tool
-from . import uuid_tool
-from . import epoch_tool
-from . import color_tool
-from . import escape_tool
+import importlib
 
 __all__ = [
     'base64_tool',
@@ -24,4 +19,25 @@ __all__ = [
     'epoch_tool',
     'color_tool',
     'escape_tool',
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    if name in __all__:
+        return importlib.import_module(f".{name}", __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def load_plugin(tool_name: str) -> bool:
+    """Import the bundled module for a tool; False if there is none"""
+    module_name = f"{tool_name}_tool"
+    if module_name not in __all__:
+        return False
+    importlib.import_module(f".{module_name}", __name__)
+    return True
+
+
+def load_all() -> None:
+    """Import every bundled plugin module"""
+    for module_name in __all__:
+        importlib.import_module(f".{module_name}", __name__)
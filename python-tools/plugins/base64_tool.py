@@ -3,25 +3,35 @@ Base64 Tool Plugin
 Provides Base64 encoding and decoding functionality
 """
 
-import base64
-from typing import Type, Literal
-from pydantic import Field, field_validator
-from core import BaseTool, ToolInput, ToolOutput, ToolConfig
+import binascii
+from dataclasses import dataclass
+from typing import Annotated, Type, Literal
+from pydantic import Field
+from core import BaseTool, DataclassInput, ToolOutput, ToolConfig
 
+# Optional SIMD base64 (see requirements.txt). Its per-call overhead only pays
+# off above a few hundred bytes; shorter inputs stay on binascii.
+try:
+    import pybase64
+except ImportError:
+    pybase64 = None
 
-class Base64Input(ToolInput):
+_PYBASE64_MIN_LEN = 256
+
+
+@dataclass(slots=True)
+class Base64Input(DataclassInput):
     """Input model for Base64 operations"""
-    text: str = Field(description="Text to encode or decode")
-    operation: Literal["encode", "decode"] = Field(
-        default="encode", 
-        description="Operation to perform"
-    )
+    text: Annotated[str, Field(description="Text to encode or decode")]
+    operation: Annotated[Literal["encode", "decode"], Field(description="Operation to perform")] = "encode"
     
-    @field_validator('text')
-    def text_not_empty(cls, v):
-        if not v.strip():
+    def __post_init__(self):
+        if not isinstance(self.text, str):
+            raise ValueError("Text must be a string")
+        if not self.text.strip():
             raise ValueError("Text cannot be empty")
-        return v
+        if self.operation not in ("encode", "decode"):
+            raise ValueError("Operation must be 'encode' or 'decode'")
 
 
 class Base64Output(ToolOutput):
@@ -35,14 +45,14 @@ class Base64Tool(BaseTool):
     """Base64 encoding/decoding tool"""
     
     def get_config(self) -> ToolConfig:
-        return ToolConfig(
+        return ToolConfig.model_construct(
             name="base64",
             description="Encode or decode Base64 strings",
             category="encoding",
             keywords=["base64", "encode", "decode", "encoding"]
         )
     
-    def get_input_model(self) -> Type[ToolInput]:
+    def get_input_model(self) -> Type[Base64Input]:
         return Base64Input
     
     def get_output_model(self) -> Type[ToolOutput]:
@@ -50,25 +60,38 @@ class Base64Tool(BaseTool):
     
     def execute(self, input_data: Base64Input) -> Base64Output:
         """Execute Base64 operation"""
-        try:
-            if input_data.operation == "decode":
-                # Decode from Base64
-                decoded = base64.b64decode(input_data.text).decode('utf-8')
-                output = decoded
+        text = input_data.text
+        if input_data.operation == "decode":
+            raw = None
+            if pybase64 is not None and len(text) >= _PYBASE64_MIN_LEN:
+                try:
+                    raw = pybase64.b64decode(text, validate=True)
+                except (binascii.Error, ValueError):
+                    pass  # e.g. line breaks; the lenient decoder below decides
+            if raw is None:
+                # Same lenient decoding as base64.b64decode(text), minus its wrapper
+                try:
+                    raw = binascii.a2b_base64(text)
+                except (binascii.Error, ValueError) as e:
+                    raise ValueError(f"Base64 decode failed: {e}")
+            try:
+                output = raw.decode('utf-8')
+            except UnicodeDecodeError as e:
+                raise ValueError(f"Base64 decode failed: decoded bytes are not valid UTF-8 ({e})")
+        else:
+            # One pass: the UTF-8 encoder already copies ASCII-only strings directly
+            try:
+                raw = text.encode('utf-8')
+            except UnicodeEncodeError as e:  # e.g. lone surrogates from JSON input
+                raise ValueError(f"Base64 encode failed: {e}")
+            if pybase64 is not None and len(raw) >= _PYBASE64_MIN_LEN:
+                output = pybase64.b64encode_as_string(raw)
             else:
-                # Encode to Base64
-                encoded = base64.b64encode(input_data.text.encode('utf-8')).decode('utf-8')
-                output = encoded
-                
-            return Base64Output(
-                input=input_data.text,
-                output=output,
-                operation=input_data.operation
-            )
-        except Exception as e:
-            raise ValueError(f"Base64 {input_data.operation} failed: {str(e)}")
-
-
-# Register the tool
-from core import registry
-registry.register_tool(Base64Tool)
\ No newline at end of file
+                # Base64 output is always ASCII
+                output = binascii.b2a_base64(raw, newline=False).decode('ascii')
+        
+        return Base64Output.model_construct(
+            input=text,
+            output=output,
+            operation=input_data.operation
+        )
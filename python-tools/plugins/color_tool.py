@@ -4,21 +4,35 @@ Converts between different color formats (HEX, RGB, HSL, etc.)
 """
 
 import re
-from typing import Type, Dict, Any, Tuple
-from pydantic import BaseModel, Field, field_validator
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Annotated, Type, Dict, Any, Tuple
+from pydantic import BaseModel, Field
 
-from core.base import BaseTool, ToolInput, ToolOutput, ToolConfig, registry
+from core.base import BaseTool, DataclassInput, ToolOutput, ToolConfig
 
+# Color syntaxes, compiled once at import
+_HEX_RE = re.compile(r'#*(?:[0-9a-fA-F]{3}){1,2}')
+_RGB_RE = re.compile(r'rgb\s*\(\s*(\d+)\s*,\s*(\d+)\s*,\s*(\d+)\s*\)', re.IGNORECASE)
+_HSL_RE = re.compile(r'hsl\s*\(\s*(\d+)\s*,\s*(\d+)%\s*,\s*(\d+)%\s*\)', re.IGNORECASE)
 
-class ColorInput(ToolInput):
+# Output components are small bounded ints (channels 0-255, hue 0-359,
+# percentages 0-100): look their text up instead of formatting per call
+_DEC = tuple(str(i) for i in range(360))
+_HEX2 = tuple(f"{i:02x}" for i in range(256))
+
+
+@dataclass(slots=True)
+class ColorInput(DataclassInput):
     """Input model for color conversion"""
-    color: str = Field(description="Color value in any supported format")
+    color: Annotated[str, Field(description="Color value in any supported format")]
     
-    @field_validator('color')
-    def color_must_not_be_empty(cls, v):
-        if not v or not v.strip():
+    def __post_init__(self):
+        if not isinstance(self.color, str):
+            raise ValueError("Color value must be a string")
+        if not self.color.strip():
             raise ValueError("Color value cannot be empty")
-        return v.strip()
+        self.color = self.color.strip()
 
 
 class ColorOutput(ToolOutput):
@@ -32,112 +46,120 @@ class ColorOutput(ToolOutput):
     css_hsl: str = Field(description="CSS hsl() format")
 
 
+# Pure conversion helpers. Design palettes reuse the same few colors, so the
+# parsers and RGB->HSL are memoized (failed parses raise and are not cached).
+
+@lru_cache(maxsize=512)
+def _parse_hex(color: str) -> Tuple[int, int, int]:
+    """Parse hex color to RGB"""
+    if not _HEX_RE.fullmatch(color):
+        if len(color.lstrip('#')) not in (3, 6):
+            raise ValueError("Invalid hex color format")
+        raise ValueError("Invalid hex color values")
+    color = color.lstrip('#')
+    if len(color) == 3:
+        color = ''.join([c*2 for c in color])
+    
+    # One int parse for all three channels, then unpack with shifts
+    v = int(color, 16)
+    return (v >> 16) & 0xFF, (v >> 8) & 0xFF, v & 0xFF
+
+
+@lru_cache(maxsize=512)
+def _parse_rgb(color: str) -> Tuple[int, int, int]:
+    """Parse RGB color string"""
+    match = _RGB_RE.match(color)
+    if not match:
+        raise ValueError("Invalid RGB format")
+    
+    r, g, b = map(int, match.groups())
+    if not all(0 <= val <= 255 for val in [r, g, b]):
+        raise ValueError("RGB values must be between 0 and 255")
+    
+    return r, g, b
+
+
+@lru_cache(maxsize=512)
+def _parse_hsl(color: str) -> Tuple[int, int, int]:
+    """Parse HSL color string and convert to RGB"""
+    match = _HSL_RE.match(color)
+    if not match:
+        raise ValueError("Invalid HSL format")
+    
+    h, s, l = map(int, match.groups())
+    if s > 100 or l > 100:
+        raise ValueError("HSL saturation and lightness must be between 0% and 100%")
+    return _hsl_to_rgb(h, s, l)
+
+
+@lru_cache(maxsize=512)
+def _rgb_to_hsl(r: int, g: int, b: int) -> Tuple[int, int, int]:
+    """Convert RGB to HSL"""
+    # Exact integer arithmetic on 0-255 channels; every division is the
+    # final truncation to the 0-360 / 0-100 output scale.
+    max_val = max(r, g, b)
+    min_val = min(r, g, b)
+    total = max_val + min_val
+    l = total * 100 // 510
+    
+    d = max_val - min_val
+    if d == 0:
+        return 0, 0, l  # achromatic
+    
+    s = d * 100 // (510 - total if total > 255 else total)
+    
+    # Only the dominant channel's hue formula is evaluated; in CPython a
+    # comparison is cheaper than the arithmetic of the two unused candidates
+    if max_val == r:
+        h = (60 * (g - b) + (360 * d if g < b else 0)) // d
+    elif max_val == g:
+        h = (60 * (b - r) + 120 * d) // d
+    else:
+        h = (60 * (r - g) + 240 * d) // d
+    
+    return h, s, l
+
+
+def _hsl_to_rgb(h: int, s: int, l: int) -> Tuple[int, int, int]:
+    """Convert HSL (degrees, percent, percent) to RGB"""
+    if s == 0:
+        v = l * 255 // 100  # achromatic
+        return v, v, v
+    
+    # q and p on a 0-10000 scale (percent * percent)
+    q = l * (100 + s) if l < 50 else (l + s) * 100 - l * s
+    p = 200 * l - q
+    
+    def hue_to_rgb(t: int) -> int:
+        # t is in degrees; multiply before dividing so only the final
+        # scale to 0-255 truncates
+        if t < 0: t += 360
+        if t > 360: t -= 360
+        if t < 60: return (p * 60 + (q - p) * t) * 255 // 600000
+        if t < 180: return q * 255 // 10000
+        if t < 240: return (p * 60 + (q - p) * (240 - t)) * 255 // 600000
+        return p * 255 // 10000
+    
+    return hue_to_rgb(h + 120), hue_to_rgb(h), hue_to_rgb(h - 120)
+
+
 class ColorTool(BaseTool):
     """Color format converter tool"""
     
     def get_config(self) -> ToolConfig:
-        return ToolConfig(
+        return ToolConfig.model_construct(
             name="color",
             description="Convert between color formats (HEX, RGB, HSL)",
             category="design",
             keywords=["color", "hex", "rgb", "hsl", "convert", "css", "design"]
         )
     
-    def get_input_model(self) -> Type[ToolInput]:
+    def get_input_model(self) -> Type[ColorInput]:
         return ColorInput
     
     def get_output_model(self) -> Type[ToolOutput]:
         return ColorOutput
     
-    def _parse_hex(self, color: str) -> Tuple[int, int, int]:
-        """Parse hex color to RGB"""
-        color = color.lstrip('#')
-        if len(color) == 3:
-            color = ''.join([c*2 for c in color])
-        if len(color) != 6:
-            raise ValueError("Invalid hex color format")
-        
-        try:
-            # Build a fixed-length 3-tuple so static type checkers know the size
-            r = int(color[0:2], 16)
-            g = int(color[2:4], 16)
-            b = int(color[4:6], 16)
-            return (r, g, b)
-        except ValueError:
-            raise ValueError("Invalid hex color values")
-    
-    def _parse_rgb(self, color: str) -> Tuple[int, int, int]:
-        """Parse RGB color string"""
-        match = re.match(r'rgb\s*\(\s*(\d+)\s*,\s*(\d+)\s*,\s*(\d+)\s*\)', color, re.IGNORECASE)
-        if not match:
-            raise ValueError("Invalid RGB format")
-        
-        r, g, b = map(int, match.groups())
-        if not all(0 <= val <= 255 for val in [r, g, b]):
-            raise ValueError("RGB values must be between 0 and 255")
-        
-        return r, g, b
-    
-    def _parse_hsl(self, color: str) -> Tuple[int, int, int]:
-        """Parse HSL color string and convert to RGB"""
-        match = re.match(r'hsl\s*\(\s*(\d+)\s*,\s*(\d+)%\s*,\s*(\d+)%\s*\)', color, re.IGNORECASE)
-        if not match:
-            raise ValueError("Invalid HSL format")
-        
-        h, s, l = map(int, match.groups())
-        return self._hsl_to_rgb(h, s/100, l/100)
-    
-    def _rgb_to_hsl(self, r: int, g: int, b: int) -> Tuple[int, int, int]:
-        """Convert RGB to HSL"""
-        # Work in floats for the conversion; annotate locals to please the type checker
-        rf: float = r / 255.0
-        gf: float = g / 255.0
-        bf: float = b / 255.0
-        max_val = max(rf, gf, bf)
-        min_val = min(rf, gf, bf)
-        h: float = 0.0
-        s: float = 0.0
-        l: float = (max_val + min_val) / 2
-        
-        if max_val == min_val:
-            h = s = 0  # achromatic
-        else:
-            d = max_val - min_val
-            s = d / (2 - max_val - min_val) if l > 0.5 else d / (max_val + min_val)
-
-            if max_val == rf:
-                h = (gf - bf) / d + (6 if gf < bf else 0)
-            elif max_val == gf:
-                h = (bf - rf) / d + 2
-            elif max_val == bf:
-                h = (rf - gf) / d + 4
-            h /= 6
-        
-        return int(h * 360), int(s * 100), int(l * 100)
-    
-    def _hsl_to_rgb(self, h: int, s: float, l: float) -> Tuple[int, int, int]:
-        """Convert HSL to RGB"""
-        def hue_to_rgb(p: float, q: float, t: float) -> float:
-            if t < 0: t += 1
-            if t > 1: t -= 1
-            if t < 1/6: return p + (q - p) * 6 * t
-            if t < 1/2: return q
-            if t < 2/3: return p + (q - p) * (2/3 - t) * 6
-            return p
-        
-        if s == 0:
-            # l is a float between 0 and 1; use floats for intermediate values
-            rf = gf = bf = l  # achromatic
-        else:
-            q = l * (1 + s) if l < 0.5 else l + s - l * s
-            p = 2 * l - q
-            hf = h / 360.0
-            rf = hue_to_rgb(p, q, hf + 1/3)
-            gf = hue_to_rgb(p, q, hf)
-            bf = hue_to_rgb(p, q, hf - 1/3)
-        
-        return int(rf * 255), int(gf * 255), int(bf * 255)
-    
     def execute(self, input_data: ColorInput) -> ColorOutput:
         """Convert color between formats"""
         color = input_data.color.strip()
@@ -146,36 +168,31 @@ class ColorTool(BaseTool):
         try:
             # Try to parse different formats
             if color.startswith('#'):
-                r, g, b = self._parse_hex(color)
+                r, g, b = _parse_hex(color)
                 input_format = "hex"
             elif color.startswith('rgb'):
-                r, g, b = self._parse_rgb(color)
+                r, g, b = _parse_rgb(color)
                 input_format = "rgb"
             elif color.startswith('hsl'):
-                r, g, b = self._parse_hsl(color)
+                r, g, b = _parse_hsl(color)
                 input_format = "hsl"
             else:
                 # Try as hex without #
-                r, g, b = self._parse_hex(color)
+                r, g, b = _parse_hex(color)
                 input_format = "hex"
             
             # Convert to other formats
-            h, s, l = self._rgb_to_hsl(r, g, b)
-            hex_color = f"#{r:02x}{g:02x}{b:02x}"
+            h, s, l = _rgb_to_hsl(r, g, b)
             
-            return ColorOutput(
+            return ColorOutput.model_construct(
                 input_color=color,
                 input_format=input_format,
-                hex=hex_color,
+                hex=f"#{_HEX2[r]}{_HEX2[g]}{_HEX2[b]}",
                 rgb={"r": r, "g": g, "b": b},
                 hsl={"h": h, "s": s, "l": l},
-                css_rgb=f"rgb({r}, {g}, {b})",
-                css_hsl=f"hsl({h}, {s}%, {l}%)"
+                css_rgb=f"rgb({_DEC[r]}, {_DEC[g]}, {_DEC[b]})",
+                css_hsl=f"hsl({_DEC[h]}, {_DEC[s]}%, {_DEC[l]}%)"
             )
             
         except ValueError as e:
             raise ValueError(f"Invalid color format: {e}")
-
-
-# Register the tool
-registry.register_tool(ColorTool, 'color')
\ No newline at end of file
@@ -4,26 +4,30 @@ Converts epoch timestamps to human-readable formats and vice versa
 """
 
 import time
+from dataclasses import dataclass
+from functools import lru_cache
 from datetime import datetime, timezone
-from typing import Type, Dict, Any, Optional
-from pydantic import BaseModel, Field, field_validator
+from typing import Annotated, Type, Dict, Any, Optional, Tuple
+from pydantic import BaseModel, Field
 
-from core.base import BaseTool, ToolInput, ToolOutput, ToolConfig, registry
+from core.base import BaseTool, DataclassInput, ToolOutput, ToolConfig
 
 
-class EpochInput(ToolInput):
+@dataclass(slots=True)
+class EpochInput(DataclassInput):
     """Input model for epoch conversion"""
-    timestamp: Optional[str] = Field(default=None, description="Epoch timestamp (leave empty for current time)")
+    timestamp: Annotated[Optional[str], Field(description="Epoch timestamp (leave empty for current time)")] = None
     
-    @field_validator('timestamp', mode='before')
-    def validate_timestamp(cls, v):
+    def __post_init__(self):
+        v = self.timestamp
         if v is None or v == "":
-            return None
-        if isinstance(v, (int, float)):
-            return str(v)
-        if not str(v).strip():
-            return None
-        return str(v).strip()
+            self.timestamp = None
+        elif isinstance(v, (int, float)):
+            self.timestamp = str(v)
+        elif not str(v).strip():
+            self.timestamp = None
+        else:
+            self.timestamp = str(v).strip()
 
 
 class EpochOutput(ToolOutput):
@@ -34,18 +38,40 @@ class EpochOutput(ToolOutput):
     relative: Dict[str, Any] = Field(description="Relative time information")
 
 
+_NS_PER_SECOND = 1_000_000_000
+_NS_PER_DAY = 86_400 * _NS_PER_SECOND
+
+_FMT_READABLE = "%Y-%m-%d %H:%M:%S"
+_FMT_DMY = "%d/%m/%Y %H:%M:%S"
+
+
+@lru_cache(maxsize=256)
+def _format_utc(epoch: int) -> Tuple[str, str, str]:
+    """UTC (readable, iso, ddmmyyyy) strings for an epoch
+    
+    Pure in the epoch, so memoized: the same instant entered in seconds and
+    in milliseconds, or re-converted, skips the datetime and strftime work.
+    """
+    utc_dt = datetime.fromtimestamp(epoch, tz=timezone.utc)
+    return utc_dt.strftime(_FMT_READABLE) + " UTC", utc_dt.isoformat(), utc_dt.strftime(_FMT_DMY)
+
+
+# (upper bound in seconds, unit, divisor) for the relative-time description
+_RELATIVE_UNITS = ((60, "seconds", 1), (3600, "minutes", 60), (86400, "hours", 3600))
+
+
 class EpochTool(BaseTool):
     """Epoch timestamp converter tool"""
     
     def get_config(self) -> ToolConfig:
-        return ToolConfig(
+        return ToolConfig.model_construct(
             name="epoch",
             description="Convert epoch timestamps to human-readable formats",
             category="time",
             keywords=["epoch", "timestamp", "unix", "time", "convert", "date"]
         )
     
-    def get_input_model(self) -> Type[ToolInput]:
+    def get_input_model(self) -> Type[EpochInput]:
         return EpochInput
     
     def get_output_model(self) -> Type[ToolOutput]:
@@ -54,7 +80,7 @@ class EpochTool(BaseTool):
     def execute(self, input_data: EpochInput) -> EpochOutput:
         """Convert epoch timestamp"""
         if input_data.timestamp is None:
-            epoch = int(time.time())
+            epoch = time.time_ns() // _NS_PER_SECOND
         else:
             try:
                 # Handle both seconds and milliseconds
@@ -66,39 +92,46 @@ class EpochTool(BaseTool):
             except ValueError:
                 raise ValueError(f"Invalid epoch timestamp: {input_data.timestamp}")
         
-        # Convert to datetime objects
-        utc_dt = datetime.fromtimestamp(epoch, tz=timezone.utc)
+        # UTC strings are cached; local time depends on the process timezone
+        utc_readable, utc_iso, utc_dmy = _format_utc(epoch)
         local_dt = datetime.fromtimestamp(epoch)
-        current_dt = datetime.now(timezone.utc)
         
-        # Calculate relative time
-        time_diff = current_dt - utc_dt
-        days_diff = time_diff.days
-        seconds_diff = int(time_diff.total_seconds())
+        # Calculate relative time; "now" is zero by definition, no second clock read
+        if input_data.timestamp is None:
+            days_diff = seconds_diff = 0
+        else:
+            # Integer nanoseconds; same rounding as timedelta (.days floors,
+            # int(total_seconds()) truncates toward zero)
+            diff_ns = time.time_ns() - epoch * _NS_PER_SECOND
+            days_diff = diff_ns // _NS_PER_DAY
+            if diff_ns >= 0:
+                seconds_diff = diff_ns // _NS_PER_SECOND
+            else:
+                seconds_diff = -(-diff_ns // _NS_PER_SECOND)
         
         # Human readable relative time
-        if abs(seconds_diff) < 60:
-            human_relative = f"{abs(seconds_diff)} seconds {'ago' if seconds_diff > 0 else 'from now'}"
-        elif abs(seconds_diff) < 3600:
-            minutes = abs(seconds_diff) // 60
-            human_relative = f"{minutes} minutes {'ago' if seconds_diff > 0 else 'from now'}"
-        elif abs(seconds_diff) < 86400:
-            hours = abs(seconds_diff) // 3600
-            human_relative = f"{hours} hours {'ago' if seconds_diff > 0 else 'from now'}"
+        abs_seconds = abs(seconds_diff)
+        direction = 'ago' if seconds_diff > 0 else 'from now'
+        for limit, unit, divisor in _RELATIVE_UNITS:
+            if abs_seconds < limit:
+                human_relative = f"{abs_seconds // divisor} {unit} {direction}"
+                break
         else:
             human_relative = f"{abs(days_diff)} days {'ago' if days_diff > 0 else 'from now'}"
         
-        return EpochOutput(
+        local_str = local_dt.strftime(_FMT_READABLE)
+        
+        return EpochOutput.model_construct(
             epoch=epoch,
             utc={
-                "readable": utc_dt.strftime("%Y-%m-%d %H:%M:%S UTC"),
-                "iso": utc_dt.isoformat(),
-                "ddmmyyyy": utc_dt.strftime("%d/%m/%Y %H:%M:%S")
+                "readable": utc_readable,
+                "iso": utc_iso,
+                "ddmmyyyy": utc_dmy
             },
             local={
-                "readable": local_dt.strftime("%Y-%m-%d %H:%M:%S %Z"),
+                "readable": f"{local_str} {local_dt.tzname() or ''}",
                 "iso": local_dt.isoformat(),
-                "ddmmyyyy": local_dt.strftime("%d/%m/%Y %H:%M:%S")
+                "ddmmyyyy": local_dt.strftime(_FMT_DMY)
             },
             relative={
                 "days": days_diff,
@@ -106,7 +139,3 @@ class EpochTool(BaseTool):
                 "human": human_relative
             }
         )
-
-
-# Register the tool
-registry.register_tool(EpochTool, 'epoch')
\ No newline at end of file
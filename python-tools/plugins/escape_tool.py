@@ -6,14 +6,145 @@ Provides tools to escape and unescape HTML, JSON, XML, and JavaScript strings
 from typing import Type, Any, Dict
 from pydantic import Field
 
-from core.base import BaseTool, ToolInput, ToolOutput, ToolConfig, registry
+from core.base import BaseTool, ToolInput, ToolOutput, ToolConfig
 
 import html
 import json as _json
+from json.encoder import encode_basestring as _encode_basestring
+from json.encoder import encode_basestring_ascii as _encode_basestring_ascii
 from xml.sax import saxutils
 import re
 
 
+# JavaScript escaping is JSON's ASCII-only string escaping (short escapes for
+# quotes, backslash and common controls, \uXXXX for other controls and all
+# non-ASCII, surrogate pairs above the BMP) done by the C encoder, plus \'
+# for single quotes; DEL, which that encoder also escapes, is kept literal
+_JS_NONASCII_RE = re.compile(r'[^\x00-\x7f]')
+
+
+def _js_escape_fast(s: str) -> str:
+    return _encode_basestring_ascii(s)[1:-1].replace("'", "\\'")
+
+
+def _js_escape(s: str) -> str:
+    if '\x7f' in s:
+        return '\x7f'.join([_js_escape_fast(part) for part in s.split('\x7f')])
+    return _js_escape_fast(s)
+
+
+# JavaScript unescaping: ASCII text whose escapes are all plain \xHH/\uHHHH
+# goes through the unicode_escape codec. Otherwise \xHH via regex, then every
+# \uHHHH (combining surrogate pairs) in one C-level pass of the JSON string
+# decoder; other backslashes are doubled first so the decoder keeps them literally
+_JS_X_RE = re.compile(r"\\x([0-9a-fA-F]{2})")
+_JS_LITERAL_BACKSLASH_RE = re.compile(r"\\(?!u[0-9a-fA-F]{4})")
+# A backslash the unicode_escape codec would not decode the way we do: anything
+# but \xHH or \uHHHH, and \x5c (we decode \x first, so its backslash can
+# start a \u escape)
+_JS_CODEC_UNSAFE_RE = re.compile(r"\\(?!x(?!5[cC])[0-9a-fA-F]{2}|u[0-9a-fA-F]{4})")
+
+
+def _repl_hex(m: "re.Match[str]") -> str:
+    return chr(int(m.group(1), 16))
+
+
+def html_unescape_text(s: str) -> str:
+    """Decode HTML character references (&amp;, &#39;, &#x1F600; ...)"""
+    return html.unescape(s)
+
+
+def js_unescape_text(s: str) -> str:
+    """Decode JavaScript string escapes (\\n, \\', \\xHH, \\uHHHH and surrogate pairs)"""
+    # Replace common escapes (order matters: \\ is handled last)
+    s = s.replace('\\n', '\n').replace('\\r', '\r').replace('\\t', '\t')
+    s = s.replace('\\b', '\b').replace('\\f', '\f')
+    s = s.replace('\\\"', '"').replace("\\'", "'").replace('\\\\', '\\')
+    if '\\' not in s:
+        return s
+    if (s.isascii() and '\\ud' not in s and '\\uD' not in s
+            and not _JS_CODEC_UNSAFE_RE.search(s)):
+        # Only \xHH and non-surrogate \uHHHH left: one C pass of the codec
+        return s.encode('ascii').decode('unicode_escape')
+    if '\\x' in s:
+        s = _JS_X_RE.sub(_repl_hex, s)
+    if '\\u' not in s:
+        return s
+    quoted = _JS_LITERAL_BACKSLASH_RE.sub(r'\\\\', s).replace('"', '\\"')
+    return _json.loads(f'"{quoted}"', strict=False)
+
+
+def _json_escape(s: str) -> str:
+    # The C string encoder behind json.dumps(ensure_ascii=False), minus its
+    # argument handling; a per-character translate table is far slower
+    return _encode_basestring(s)[1:-1]
+
+
+_ESCAPERS = {
+    "html": html.escape,
+    "json": _json_escape,
+    "xml": saxutils.escape,
+    "javascript": _js_escape,
+}
+
+
+def _json_unescape(s: str) -> str:
+    # Try to decode as a JSON string
+    try:
+        return _json.loads(f'"{s.replace('"', '\\"')}"')
+    except Exception:
+        # fallback: unescape common sequences
+        return s.encode('utf-8').decode('unicode_escape')
+
+
+_UNESCAPERS = {
+    "html": html_unescape_text,
+    "json": _json_unescape,
+    "xml": saxutils.unescape,
+    "javascript": js_unescape_text,
+}
+
+# Characters each escaper rewrites; JSON and JavaScript also escape control
+# characters and JavaScript escapes all non-ASCII
+_ESCAPE_SPECIALS = {"html": "&<>\"'", "xml": "&<>", "json": "\"\\", "javascript": "\"'\\"}
+_CONTROL_BYTES = bytes(range(0x20))
+_CONTROL_CHARS = tuple(chr(i) for i in range(0x20))
+
+
+def _first_escapable(text: str, fmt: str) -> int:
+    """Index of the first character the escaper for fmt would change, or -1
+    
+    All the escapers map characters independently, so everything before this
+    index can be copied verbatim. Uses only C-level scans: str.find (memchr,
+    vectorized in libc) for the special characters, each bounded by the best
+    hit so far, and str.isascii / bytes.translate to rule out non-ASCII and
+    control characters before locating them.
+    """
+    end = len(text)
+    for ch in _ESCAPE_SPECIALS[fmt]:
+        i = text.find(ch, 0, end)
+        if i >= 0:
+            end = i
+    if fmt == "javascript" and not text.isascii():
+        m = _JS_NONASCII_RE.search(text, 0, end)
+        if m:
+            end = m.start()
+    if fmt in ("json", "javascript") and end:
+        head = text if end == len(text) else text[:end]
+        try:
+            raw = head.encode("utf-8")
+            # UTF-8 never uses bytes below 0x20 inside multi-byte sequences
+            has_control = len(raw.translate(None, _CONTROL_BYTES)) != len(raw)
+        except UnicodeEncodeError:  # lone surrogates
+            has_control = True
+        if has_control:
+            for ch in _CONTROL_CHARS:
+                i = text.find(ch, 0, end)
+                if i >= 0:
+                    end = i
+    return end if end < len(text) else -1
+
+
 class EscapeInput(ToolInput):
     text: str = Field(description="Text to escape or unescape")
     operation: str = Field(description="escape or unescape", default="escape")
@@ -29,7 +160,7 @@ class EscapeOutput(ToolOutput):
 
 class EscapeTool(BaseTool):
     def get_config(self) -> ToolConfig:
-        return ToolConfig(
+        return ToolConfig.model_construct(
             name="escape",
             description="Escape or unescape text for HTML, JSON, XML or JavaScript",
             category="escape/unescape",
@@ -49,103 +180,16 @@ class EscapeTool(BaseTool):
 
         if op not in ("escape", "unescape"):
             raise ValueError("operation must be 'escape' or 'unescape'")
-        if fmt not in ("html", "json", "xml", "javascript"):
+        if fmt not in _ESCAPERS:
             raise ValueError("format must be one of: html, json, xml, javascript")
 
-        if fmt == "html":
-            if op == "escape":
-                out = html.escape(text)
-            else:
-                out = html.unescape(text)
-
-        elif fmt == "json":
-            if op == "escape":
-                # Use json encoding to escape
-                out = _json.dumps(text, ensure_ascii=False)[1:-1]
-            else:
-                # Try to decode as a JSON string
-                try:
-                    out = _json.loads(f'"{text.replace('"', '\\"')}"')
-                except Exception:
-                    # fallback: unescape common sequences
-                    out = text.encode('utf-8').decode('unicode_escape')
-
-        elif fmt == "xml":
-            if op == "escape":
-                out = saxutils.escape(text)
-            else:
-                out = saxutils.unescape(text)
-
-        else:  # javascript
-            if op == "escape":
-                # More complete JS escaping: escape control chars, quotes, backslashes, and non-ascii as \uXXXX
-                def js_escape(s: str) -> str:
-                    res = []
-                    for ch in s:
-                        o = ord(ch)
-                        if ch == '"':
-                            res.append('\\\"')
-                        elif ch == "'":
-                            res.append("\\'")
-                        elif ch == "\\":
-                            res.append('\\\\')
-                        elif ch == '\n':
-                            res.append('\\n')
-                        elif ch == '\r':
-                            res.append('\\r')
-                        elif ch == '\t':
-                            res.append('\\t')
-                        elif ch == '\b':
-                            res.append('\\b')
-                        elif ch == '\f':
-                            res.append('\\f')
-                        elif o < 32:
-                            # other control chars
-                            res.append('\\u%04x' % o)
-                        elif o > 0x7f:
-                            # non-ascii -> unicode escape. For codepoints > 0xFFFF produce surrogate pairs
-                            if o <= 0xFFFF:
-                                res.append('\\u%04x' % o)
-                            else:
-                                cp = o - 0x10000
-                                high = 0xD800 + (cp >> 10)
-                                low = 0xDC00 + (cp & 0x3FF)
-                                res.append('\\u%04x\\u%04x' % (high, low))
-                        else:
-                            res.append(ch)
-                    return ''.join(res)
-
-                out = js_escape(text)
-            else:
-                # Unescape JS sequences: \n, \r, \t, \uXXXX, \xXX, \" etc.
-                def js_unescape(s: str) -> str:
-                    # Replace common escapes
-                    s = s.replace('\\n', '\n').replace('\\r', '\r').replace('\\t', '\t')
-                    s = s.replace('\\b', '\b').replace('\\f', '\f')
-                    s = s.replace('\\\"', '"').replace("\\'", "'").replace('\\\\', '\\')
-                    # Handle \xHH
-                    def repl_x(m):
-                        return chr(int(m.group(1), 16))
-                    s = re.sub(r"\\x([0-9a-fA-F]{2})", repl_x, s)
-
-                    # First handle surrogate pairs like \uD83D\uDE00 -> single codepoint
-                    def repl_surrogate(m):
-                        hi = int(m.group(1), 16)
-                        lo = int(m.group(2), 16)
-                        cp = ((hi - 0xD800) << 10) + (lo - 0xDC00) + 0x10000
-                        return chr(cp)
-                    s = re.sub(r"\\u([dD][89abAB][0-9a-fA-F]{2})\\u([dD][cdefCDEF][0-9a-fA-F]{2})", repl_surrogate, s)
-
-                    # Then handle remaining \uHHHH
-                    def repl_u(m):
-                        return chr(int(m.group(1), 16))
-                    s = re.sub(r"\\u([0-9a-fA-F]{4})", repl_u, s)
-                    return s
-
-                out = js_unescape(text)
+        if op == "escape":
+            # Copy the clean prefix verbatim and escape only from the first
+            # escapable character on; clean input is returned unchanged
+            start = _first_escapable(text, fmt)
+            out = text if start < 0 else text[:start] + _ESCAPERS[fmt](text[start:])
 
-        return EscapeOutput(input_text=text, output_text=out, operation=op, format=fmt)
+        else:
+            out = _UNESCAPERS[fmt](text)
 
-
-# Register
-registry.register_tool(EscapeTool, 'escape')
+        return EscapeOutput(input_text=text, output_text=out, operation=op, format=fmt)
@@ -4,10 +4,56 @@ Formats, validates, and minifies JSON strings
 """
 
 import json
-from typing import Type, Any, Dict
+from typing import Type, Any, Dict, Tuple
 from pydantic import BaseModel, Field, field_validator
 
-from core.base import BaseTool, ToolInput, ToolOutput, ToolConfig, registry
+from core.base import BaseTool, ToolInput, ToolOutput, ToolConfig
+
+# Optional fast JSON backends (see requirements.txt)
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _loads(text: str) -> Tuple[Any, bool]:
+    """Parse JSON losslessly; returns (data, strict)
+    
+    msgspec parses strict JSON and keeps integers of any width. orjson is not
+    used for parsing because it silently turns integers wider than 64 bits
+    into floats. Input msgspec rejects (e.g. NaN/Infinity, lone surrogates)
+    goes through the stdlib, which raises json.JSONDecodeError for invalid JSON.
+    """
+    if msgspec is not None:
+        try:
+            return msgspec.json.decode(text), True
+        except (msgspec.DecodeError, msgspec.ValidationError):
+            pass
+    return json.loads(text), False
+
+
+def _dumps(data: Any, minify: bool, strict: bool) -> str:
+    """Serialize parsed JSON with the same layout as the stdlib settings below
+    
+    orjson output matches the stdlib's except for float exponents (1e-7 rather
+    than 1e-07). It is only used for strictly parsed data: it would write
+    NaN/Infinity as null, where the stdlib keeps them.
+    """
+    if orjson is not None and strict:
+        option = 0 if minify else orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS
+        try:
+            return orjson.dumps(data, option=option).decode('utf-8')
+        except TypeError:
+            # Integers wider than 64 bits or nesting deeper than orjson allows
+            pass
+    if minify:
+        return json.dumps(data, separators=(',', ':'), ensure_ascii=False)
+    return json.dumps(data, indent=2, ensure_ascii=False, sort_keys=True)
 
 
 class JSONInput(ToolInput):
@@ -38,7 +84,7 @@ class JSONTool(BaseTool):
     """JSON formatter and validator tool"""
     
     def get_config(self) -> ToolConfig:
-        return ToolConfig(
+        return ToolConfig.model_construct(
             name="json",
             description="Format, validate, and minify JSON strings",
             category="text",
@@ -51,6 +97,17 @@ class JSONTool(BaseTool):
     def get_output_model(self) -> Type[ToolOutput]:
         return JSONOutput
     
+    def format_output(self, output: ToolOutput) -> Dict[str, Any]:
+        """Format output as dictionary, passing parsed_data through as-is
+        
+        parsed_data comes straight from the JSON parser, so it is already plain
+        dicts/lists/scalars; model_dump would only re-walk (and copy) the whole
+        tree inferring a serializer for every Any value.
+        """
+        result = output.model_dump(exclude={"parsed_data"})
+        result["parsed_data"] = output.parsed_data
+        return result
+    
     def execute(self, input_data: JSONInput) -> JSONOutput:
         """Format or minify JSON"""
         text = input_data.text
@@ -58,34 +115,29 @@ class JSONTool(BaseTool):
         # Try parsing JSON first.
         parse_text = text
         try:
-            parsed_data = json.loads(parse_text)
+            parsed_data, strict = _loads(parse_text)
         except json.JSONDecodeError:
             # If parsing failed, optionally try a best-effort auto-unescape and parse again
             if input_data.auto_unescape:
+                # Plain string transforms; imported here so only this recovery path loads them
+                from .escape_tool import html_unescape_text, js_unescape_text
+                parse_text = js_unescape_text(html_unescape_text(parse_text))
                 try:
-                    from .escape_tool import EscapeTool
-                    et = EscapeTool()
-                    html_out = et.run({"text": parse_text, "operation": "unescape", "format": "html"})
-                    parse_text = html_out.get("output_text", parse_text)
-                    js_out = et.run({"text": parse_text, "operation": "unescape", "format": "javascript"})
-                    parse_text = js_out.get("output_text", parse_text)
-                except Exception:
-                    # best-effort: if unescape fails, continue to raise parse error below
-                    pass
-                try:
-                    parsed_data = json.loads(parse_text)
+                    parsed_data, strict = _loads(parse_text)
                 except json.JSONDecodeError as e:
                     raise ValueError(f"Invalid JSON after auto-unescape: {e}")
             else:
                 raise ValueError("Invalid JSON: could not parse input")
 
+        # parsed_data is typed as an object; the output is no longer validated,
+        # so reject other top-level values here
+        if not isinstance(parsed_data, dict):
+            raise ValueError(f"JSON root must be an object, got {type(parsed_data).__name__}")
+
         # Format or minify
-        if input_data.minify:
-            formatted = json.dumps(parsed_data, separators=(',', ':'), ensure_ascii=False)
-        else:
-            formatted = json.dumps(parsed_data, indent=2, ensure_ascii=False, sort_keys=True)
+        formatted = _dumps(parsed_data, input_data.minify, strict)
 
-        return JSONOutput(
+        return JSONOutput.model_construct(
             formatted=formatted,
             original=parse_text,
             operation=operation,
@@ -94,7 +146,3 @@ class JSONTool(BaseTool):
             size_after=len(formatted),
             parsed_data=parsed_data
         )
-
-
-# Register the tool
-registry.register_tool(JSONTool, 'json')
\ No newline at end of file
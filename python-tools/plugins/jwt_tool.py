@@ -4,12 +4,20 @@ Decodes and validates JSON Web Tokens (JWT)
 """
 
 import json
-import base64
+import time
 from datetime import datetime, timezone
-from typing import Any, Dict, Optional, Type
+from typing import Any, Dict, List, Optional, Type
 from pydantic import BaseModel, Field, field_validator
 
-from core.base import BaseTool, ToolInput, ToolOutput, ToolConfig, registry
+from core.base import BaseTool, ToolInput, ToolOutput, ToolConfig
+
+# Prefer the SIMD-accelerated pybase64 when installed; it mirrors the stdlib API.
+try:
+    import pybase64 as _b64
+except ImportError:
+    import base64 as _b64
+
+_FMT_UTC = "%Y-%m-%d %H:%M:%S UTC"
 
 
 class JWTInput(ToolInput):
@@ -40,7 +48,7 @@ class JWTTool(BaseTool):
     """JWT decoder tool for analyzing JSON Web Tokens"""
     
     def get_config(self) -> ToolConfig:
-        return ToolConfig(
+        return ToolConfig.model_construct(
             name="jwt",
             description="Decode and analyze JSON Web Tokens (JWT)",
             category="security",
@@ -55,22 +63,65 @@ class JWTTool(BaseTool):
     
     def _decode_base64_url(self, data: str) -> Dict[str, Any]:
         """Decode base64url encoded JWT part"""
-        # Add padding if needed
-        data += '=' * (4 - len(data) % 4)
         try:
-            decoded = base64.urlsafe_b64decode(data)
-            return json.loads(decoded.decode('utf-8'))
+            raw = data.encode('ascii')
+            # Restore the stripped padding: -len & 3 is the count needed to reach a multiple of 4
+            raw += b'=' * (-len(raw) & 3)
+            # Decode explicitly: json.loads(bytes) would also accept UTF-16/32
+            # and a UTF-8 BOM, but RFC 7519 requires plain UTF-8
+            return json.loads(_b64.urlsafe_b64decode(raw).decode('utf-8'))
         except Exception as e:
             raise ValueError(f"Invalid base64url encoding: {e}")
     
     def _format_timestamp(self, timestamp: int) -> str:
         """Format timestamp to human readable string"""
         try:
-            dt = datetime.fromtimestamp(timestamp, tz=timezone.utc)
-            return dt.strftime("%Y-%m-%d %H:%M:%S UTC")
+            return datetime.fromtimestamp(timestamp, tz=timezone.utc).strftime(_FMT_UTC)
         except Exception:
             return "Invalid timestamp"
     
+    def _invalid_output(self) -> JWTOutput:
+        """Output for a token that doesn't have three dot-separated parts"""
+        return JWTOutput(
+            header={},
+            payload={},
+            signature="",
+            issued_at=None,
+            expires_at=None,
+            issued_at_readable=None,
+            expires_at_readable=None,
+            is_expired=None,
+            valid_format=False
+        )
+    
+    def _build_output(self, header: Dict[str, Any], payload: Dict[str, Any], signature: str,
+                      now: Optional[int] = None) -> JWTOutput:
+        """Build the output for a decoded token; now defaults to the current time"""
+        # Extract timestamps
+        issued_at = payload.get('iat')
+        expires_at = payload.get('exp')
+        
+        # Format readable timestamps
+        issued_at_readable = self._format_timestamp(issued_at) if issued_at else None
+        expires_at_readable = self._format_timestamp(expires_at) if expires_at else None
+        
+        # Check if expired (time.time() avoids building an aware datetime)
+        is_expired = None
+        if expires_at:
+            is_expired = expires_at < (int(time.time()) if now is None else now)
+        
+        return JWTOutput(
+            header=header,
+            payload=payload,
+            signature=signature,
+            issued_at=issued_at,
+            expires_at=expires_at,
+            issued_at_readable=issued_at_readable,
+            expires_at_readable=expires_at_readable,
+            is_expired=is_expired,
+            valid_format=True
+        )
+    
     def execute(self, input_data: JWTInput) -> JWTOutput:
         """Decode JWT token"""
         token = input_data.token.strip()
@@ -78,53 +129,30 @@ class JWTTool(BaseTool):
         # Split JWT into parts
         parts = token.split('.')
         if len(parts) != 3:
-            return JWTOutput(
-                header={},
-                payload={},
-                signature="",
-                issued_at=None,
-                expires_at=None,
-                issued_at_readable=None,
-                expires_at_readable=None,
-                is_expired=None,
-                valid_format=False
-            )
+            return self._invalid_output()
         
         try:
             # Decode header and payload
             header = self._decode_base64_url(parts[0])
             payload = self._decode_base64_url(parts[1])
-            signature = parts[2]
-            
-            # Extract timestamps
-            issued_at = payload.get('iat')
-            expires_at = payload.get('exp')
-            
-            # Format readable timestamps
-            issued_at_readable = self._format_timestamp(issued_at) if issued_at else None
-            expires_at_readable = self._format_timestamp(expires_at) if expires_at else None
-            
-            # Check if expired
-            is_expired = None
-            if expires_at:
-                current_time = int(datetime.now(timezone.utc).timestamp())
-                is_expired = expires_at < current_time
-            
-            return JWTOutput(
-                header=header,
-                payload=payload,
-                signature=signature,
-                issued_at=issued_at,
-                expires_at=expires_at,
-                issued_at_readable=issued_at_readable,
-                expires_at_readable=expires_at_readable,
-                is_expired=is_expired,
-                valid_format=True
-            )
-            
+            return self._build_output(header, payload, parts[2])
+        except Exception as e:
+            raise ValueError(f"Failed to decode JWT: {e}")
+    
+    def execute_many(self, tokens: List[str]) -> List[JWTOutput]:
+        """Decode many tokens, in input order
+        
+        Each distinct header or payload segment in the batch is decoded once,
+        so tokens from one issuer (sharing a header) pay for a single header
+        decode. Expiry is checked against one clock reading for the batch.
+        """
+        rows = [JWTInput(token=token).token.split('.') for token in tokens]
+        segments = dict.fromkeys(segment for parts in rows if len(parts) == 3 for segment in parts[:2])
+        try:
+            decoded = {segment: self._decode_base64_url(segment) for segment in segments}
+            now = int(time.time())
+            return [self._build_output(decoded[parts[0]], decoded[parts[1]], parts[2], now)
+                    if len(parts) == 3 else self._invalid_output()
+                    for parts in rows]
         except Exception as e:
             raise ValueError(f"Failed to decode JWT: {e}")
-
-
-# Register the tool
-registry.register_tool(JWTTool, 'jwt')
\ No newline at end of file
@@ -3,11 +3,30 @@ UUID Generator Plugin
 Generates UUID v1 or v4 identifiers
 """
 
+import os
+import re
 import uuid
 from typing import Type, List
 from pydantic import BaseModel, Field, field_validator
 
-from core.base import BaseTool, ToolInput, ToolOutput, ToolConfig, registry
+from core.base import BaseTool, ToolInput, ToolOutput, ToolConfig
+
+
+# Byte maps that stamp the version (4) and RFC 4122 variant bits, applied to
+# every UUID's 7th and 9th byte at once with bytes.translate
+_VERSION_4 = bytes((b & 0x0f) | 0x40 for b in range(256))
+_VARIANT_RFC4122 = bytes((b & 0x3f) | 0x80 for b in range(256))
+
+# Splits each 32-digit run of the batch's hex into its 8-4-4-4-12 groups
+_UUID_GROUPS_RE = re.compile(r'(.{8})(.{4})(.{4})(.{4})(.{12})')
+
+
+def _uuid4_batch(count: int) -> List[str]:
+    """Generate `count` random (v4) UUID strings from a single urandom read"""
+    buf = bytearray(os.urandom(16 * count))
+    buf[6::16] = buf[6::16].translate(_VERSION_4)
+    buf[8::16] = buf[8::16].translate(_VARIANT_RFC4122)
+    return list(map('-'.join, _UUID_GROUPS_RE.findall(buf.hex())))
 
 
 class UUIDInput(ToolInput):
@@ -16,12 +35,14 @@ class UUIDInput(ToolInput):
     count: int = Field(default=1, description="Number of UUIDs to generate")
     
     @field_validator('version')
+    @classmethod
     def version_must_be_valid(cls, v):
         if v not in [1, 4]:
             raise ValueError("UUID version must be 1 or 4")
         return v
 
     @field_validator('count')
+    @classmethod
     def count_must_be_positive(cls, v):
         if v < 1 or v > 100:
             raise ValueError("Count must be between 1 and 100")
@@ -40,7 +61,7 @@ class UUIDTool(BaseTool):
     """UUID generator tool for creating unique identifiers"""
     
     def get_config(self) -> ToolConfig:
-        return ToolConfig(
+        return ToolConfig.model_construct(
             name="uuid",
             description="Generate UUID v1 or v4 unique identifiers",
             category="text",
@@ -55,15 +76,10 @@ class UUIDTool(BaseTool):
     
     def execute(self, input_data: UUIDInput) -> UUIDOutput:
         """Generate UUIDs"""
-        uuids = []
-        
-        for _ in range(input_data.count):
-            if input_data.version == 1:
-                generated_uuid = str(uuid.uuid1())
-            else:  # version 4
-                generated_uuid = str(uuid.uuid4())
-            
-            uuids.append(generated_uuid)
+        if input_data.version == 1:
+            uuids = [str(uuid.uuid1()) for _ in range(input_data.count)]
+        else:  # version 4
+            uuids = _uuid4_batch(input_data.count)
         
         return UUIDOutput(
             uuids=uuids,
@@ -71,7 +87,3 @@ class UUIDTool(BaseTool):
             count=len(uuids),
             format="8-4-4-4-12 hexadecimal digits"
         )
-
-
-# Register the tool
-registry.register_tool(UUIDTool, 'uuid')
\ No newline at end of file
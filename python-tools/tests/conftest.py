@@ -0,0 +1,11 @@
+"""
+Pytest configuration
+Makes the project root importable once for every test module
+"""
+
+import os
+import sys
+
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _ROOT not in sys.path:
+    sys.path.insert(0, _ROOT)
@@ -2,26 +2,29 @@
 Test Base64 Tool Plugin
 """
 
+import base64
+import os
 import sys
 import unittest
-from pathlib import Path
 
-# Add parent directory to path
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
-from core import registry
-import plugins.base64_tool
+# Make the project root importable however this module is run (pytest also uses conftest.py)
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _ROOT not in sys.path:
+    sys.path.insert(0, _ROOT)
 
 
 class TestBase64Tool(unittest.TestCase):
     """Test Base64 tool functionality"""
     
-    def setUp(self):
+    @classmethod
+    def setUpClass(cls):
         """Set up test fixtures"""
-        self.tool = registry.get_tool('base64')
+        from plugins.base64_tool import Base64Tool
+        cls.tool = Base64Tool()
     
     def test_tool_registration(self):
         """Test that tool is properly registered"""
+        from core import registry
         self.assertIn('base64', registry.list_tools())
         self.assertEqual(self.tool.config.name, 'base64')
         self.assertEqual(self.tool.config.category, 'encoding')
@@ -62,6 +65,17 @@ class TestBase64Tool(unittest.TestCase):
         
         self.assertEqual(decoded_result['output'], original_text)
     
+    def test_large_round_trip(self):
+        """Test long inputs, including line-wrapped base64, round-trip"""
+        original_text = "The quick brown fox jumps over the lazy dog \u00e9 " * 40
+        encoded = self.tool.run({"text": original_text, "operation": "encode"})['output']
+        self.assertEqual(encoded, base64.b64encode(original_text.encode('utf-8')).decode('ascii'))
+        
+        wrapped = "\n".join(encoded[i:i + 76] for i in range(0, len(encoded), 76))
+        for text in (encoded, wrapped):
+            decoded = self.tool.run({"text": text, "operation": "decode"})
+            self.assertEqual(decoded['output'], original_text)
+    
     def test_empty_text_validation(self):
         """Test validation for empty text"""
         input_data = {"text": "", "operation": "encode"}
@@ -86,6 +100,21 @@ class TestBase64Tool(unittest.TestCase):
         self.assertIn('error', result)
         self.assertIn('failed', result['error'])
     
+    def test_decode_non_utf8_bytes(self):
+        """Test decoding base64 of bytes that are not valid UTF-8"""
+        input_data = {"text": "/w==", "operation": "decode"}
+        result = self.tool.run(input_data)
+        
+        self.assertIn('error', result)
+        self.assertIn('not valid UTF-8', result['error'])
+
+    def test_encode_lone_surrogate(self):
+        """Test encoding text that has no UTF-8 form reports an encode failure"""
+        result = self.tool.run({"text": "a\ud800", "operation": "encode"})
+
+        self.assertEqual(result['type'], 'ValueError')
+        self.assertIn('Base64 encode failed', result['error'])
+
     def test_unicode_text(self):
         """Test with unicode characters"""
         unicode_text = "Hello 世界! 🌍"
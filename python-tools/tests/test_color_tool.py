@@ -4,22 +4,26 @@ Test Color Tool Plugin
 Tests the color conversion functionality
 """
 
+import colorsys
 import unittest
 import sys
 import os
 
-# Add the parent directory to the path so we can import our modules
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
-
-from plugins.color_tool import ColorTool, ColorInput
+# Make the project root importable however this module is run (pytest also uses conftest.py)
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _ROOT not in sys.path:
+    sys.path.insert(0, _ROOT)
 
 
 class TestColorTool(unittest.TestCase):
     """Test cases for Color tool"""
     
-    def setUp(self):
+    @classmethod
+    def setUpClass(cls):
         """Set up test fixtures"""
-        self.tool = ColorTool()
+        from plugins.color_tool import ColorTool, ColorInput
+        cls.tool = ColorTool()
+        cls.ColorInput = ColorInput
     
     def test_tool_config(self):
         """Test tool configuration"""
@@ -28,117 +32,58 @@ class TestColorTool(unittest.TestCase):
         self.assertEqual(config.category, "design")
         self.assertIn("color", config.keywords)
     
-    def test_hex_color_conversion(self):
-        """Test hex color conversion"""
-        input_data = ColorInput(color="#ff0000")  # Red
-        result = self.tool.execute(input_data)
-        
-        self.assertEqual(result.input_format, "hex")
-        self.assertEqual(result.hex, "#ff0000")
-        self.assertEqual(result.rgb["r"], 255)
-        self.assertEqual(result.rgb["g"], 0)
-        self.assertEqual(result.rgb["b"], 0)
-        self.assertEqual(result.css_rgb, "rgb(255, 0, 0)")
-    
-    def test_hex_without_hash(self):
-        """Test hex color without # prefix"""
-        input_data = ColorInput(color="00ff00")  # Green
-        result = self.tool.execute(input_data)
-        
-        self.assertEqual(result.input_format, "hex")
-        self.assertEqual(result.hex, "#00ff00")
-        self.assertEqual(result.rgb["r"], 0)
-        self.assertEqual(result.rgb["g"], 255)
-        self.assertEqual(result.rgb["b"], 0)
-    
-    def test_short_hex_color(self):
-        """Test short hex color conversion"""
-        input_data = ColorInput(color="#f0a")  # Pink shorthand
-        result = self.tool.execute(input_data)
-        
-        self.assertEqual(result.hex, "#ff00aa")
-        self.assertEqual(result.rgb["r"], 255)
-        self.assertEqual(result.rgb["g"], 0)
-        self.assertEqual(result.rgb["b"], 170)
-    
-    def test_rgb_color_conversion(self):
-        """Test RGB color conversion"""
-        input_data = ColorInput(color="rgb(128, 128, 128)")  # Gray
-        result = self.tool.execute(input_data)
-        
-        self.assertEqual(result.input_format, "rgb")
-        self.assertEqual(result.rgb["r"], 128)
-        self.assertEqual(result.rgb["g"], 128)
-        self.assertEqual(result.rgb["b"], 128)
-        self.assertEqual(result.hex, "#808080")
-        self.assertEqual(result.css_rgb, "rgb(128, 128, 128)")
-    
-    def test_hsl_color_conversion(self):
-        """Test HSL color conversion"""
-        input_data = ColorInput(color="hsl(0, 100%, 50%)")  # Red
-        result = self.tool.execute(input_data)
-        
-        self.assertEqual(result.input_format, "hsl")
-        self.assertEqual(result.rgb["r"], 255)
-        self.assertEqual(result.rgb["g"], 0)
-        self.assertEqual(result.rgb["b"], 0)
-        self.assertEqual(result.hex, "#ff0000")
-    
-    def test_white_color(self):
-        """Test white color conversion"""
-        input_data = ColorInput(color="#ffffff")
-        result = self.tool.execute(input_data)
-        
-        self.assertEqual(result.rgb["r"], 255)
-        self.assertEqual(result.rgb["g"], 255)
-        self.assertEqual(result.rgb["b"], 255)
-        self.assertEqual(result.hsl["h"], 0)
-        self.assertEqual(result.hsl["s"], 0)
-        self.assertEqual(result.hsl["l"], 100)
-    
-    def test_black_color(self):
-        """Test black color conversion"""
-        input_data = ColorInput(color="#000000")
-        result = self.tool.execute(input_data)
-        
-        self.assertEqual(result.rgb["r"], 0)
-        self.assertEqual(result.rgb["g"], 0)
-        self.assertEqual(result.rgb["b"], 0)
-        self.assertEqual(result.hsl["h"], 0)
-        self.assertEqual(result.hsl["s"], 0)
-        self.assertEqual(result.hsl["l"], 0)
-    
-    def test_blue_color_hsl(self):
-        """Test blue color HSL conversion"""
-        input_data = ColorInput(color="#0000ff")  # Pure blue
-        result = self.tool.execute(input_data)
-        
-        self.assertEqual(result.hsl["h"], 240)  # Blue hue
-        self.assertEqual(result.hsl["s"], 100)  # Full saturation
-        self.assertEqual(result.hsl["l"], 50)   # 50% lightness
+    # (input, detected format, rgb, hex, (h, s, l))
+    CASES = (
+        ("#ff0000", "hex", (255, 0, 0), "#ff0000", (0, 100, 50)),              # Red
+        ("00ff00", "hex", (0, 255, 0), "#00ff00", (120, 100, 50)),             # Hex without #
+        ("#f0a", "hex", (255, 0, 170), "#ff00aa", (320, 100, 50)),             # Shorthand hex
+        ("rgb(128, 128, 128)", "rgb", (128, 128, 128), "#808080", (0, 0, 50)),  # Gray
+        ("hsl(0, 100%, 50%)", "hsl", (255, 0, 0), "#ff0000", (0, 100, 50)),    # Red
+        ("#ffffff", "hex", (255, 255, 255), "#ffffff", (0, 0, 100)),           # White
+        ("#000000", "hex", (0, 0, 0), "#000000", (0, 0, 0)),                   # Black
+        ("#0000ff", "hex", (0, 0, 255), "#0000ff", (240, 100, 50)),            # Pure blue
+    )
+    
+    def test_conversions(self):
+        """Test hex, RGB and HSL inputs convert to every output format"""
+        for color, input_format, (r, g, b), hex_color, (h, s, l) in self.CASES:
+            with self.subTest(color=color):
+                result = self.tool.execute(self.ColorInput(color=color))
+                
+                self.assertEqual(result.input_format, input_format)
+                self.assertEqual(result.rgb, {"r": r, "g": g, "b": b})
+                self.assertEqual(result.hex, hex_color)
+                self.assertEqual((result.hsl["h"], result.hsl["s"], result.hsl["l"]), (h, s, l))
+                self.assertEqual(result.css_rgb, f"rgb({r}, {g}, {b})")
     
     def test_invalid_hex_color(self):
         """Test handling invalid hex color"""
         with self.assertRaises(ValueError):
-            input_data = ColorInput(color="#gggggg")  # Invalid hex chars
+            input_data = self.ColorInput(color="#gggggg")  # Invalid hex chars
             self.tool.execute(input_data)
     
     def test_invalid_rgb_color(self):
         """Test handling invalid RGB color"""
         with self.assertRaises(ValueError):
-            input_data = ColorInput(color="rgb(300, 128, 128)")  # Value too high
+            input_data = self.ColorInput(color="rgb(300, 128, 128)")  # Value too high
+            self.tool.execute(input_data)
+    
+    def test_invalid_hsl_color(self):
+        """Test handling out-of-range HSL percentages"""
+        with self.assertRaises(ValueError):
+            input_data = self.ColorInput(color="hsl(0, 150%, 50%)")  # Saturation too high
             self.tool.execute(input_data)
     
     def test_invalid_color_format(self):
         """Test handling completely invalid color format"""
         with self.assertRaises(ValueError):
-            input_data = ColorInput(color="not_a_color")
+            input_data = self.ColorInput(color="not_a_color")
             self.tool.execute(input_data)
     
     def test_empty_color(self):
         """Test handling empty color input"""
         with self.assertRaises(Exception):
-            ColorInput(color="")
+            self.ColorInput(color="")
     
     def test_rgb_to_hsl_roundtrip(self):
         """Test RGB to HSL conversion accuracy"""
@@ -152,16 +97,44 @@ class TestColorTool(unittest.TestCase):
         ]
         
         for hex_color, expected_h, expected_s, expected_l in colors_to_test:
-            input_data = ColorInput(color=hex_color)
-            result = self.tool.execute(input_data)
-            
-            self.assertAlmostEqual(result.hsl["h"], expected_h, delta=1)
-            self.assertAlmostEqual(result.hsl["s"], expected_s, delta=1)
-            self.assertAlmostEqual(result.hsl["l"], expected_l, delta=1)
+            with self.subTest(color=hex_color):
+                input_data = self.ColorInput(color=hex_color)
+                result = self.tool.execute(input_data)
+                
+                self.assertAlmostEqual(result.hsl["h"], expected_h, delta=1)
+                self.assertAlmostEqual(result.hsl["s"], expected_s, delta=1)
+                self.assertAlmostEqual(result.hsl["l"], expected_l, delta=1)
+    
+    def test_rgb_to_hsl_matches_reference(self):
+        """Test RGB to HSL against colorsys over the 216-color web-safe palette"""
+        steps = range(0, 256, 51)
+        palette = [(r, g, b) for r in steps for g in steps for b in steps]
+        # Reference for the whole palette up front, then compare row by row
+        reference = [colorsys.rgb_to_hls(r / 255, g / 255, b / 255) for r, g, b in palette]
+        
+        for (r, g, b), (h, l, s) in zip(palette, reference):
+            hex_color = "#%02x%02x%02x" % (r, g, b)
+            with self.subTest(color=hex_color):
+                hsl = self.tool.execute(self.ColorInput(color=hex_color)).hsl
+                
+                # Tool values are rounded to whole degrees/percent
+                self.assertAlmostEqual(hsl["h"] % 360, h * 360, delta=0.5)
+                self.assertAlmostEqual(hsl["s"], s * 100, delta=0.5)
+                self.assertAlmostEqual(hsl["l"], l * 100, delta=0.5)
+    
+    def test_exact_integer_conversion(self):
+        """Test conversions land on exact values instead of float-truncated ones"""
+        # Hue is exactly 220 degrees; float math used to truncate to 219
+        result = self.tool.execute(self.ColorInput(color="rgb(0, 1, 3)"))
+        self.assertEqual(result.hsl["h"], 220)
+        
+        # 100% lightness is white regardless of saturation
+        result = self.tool.execute(self.ColorInput(color="hsl(0, 13%, 100%)"))
+        self.assertEqual(result.hex, "#ffffff")
     
     def test_css_output_formats(self):
         """Test CSS output format correctness"""
-        input_data = ColorInput(color="#8A2BE2")  # Blue Violet
+        input_data = self.ColorInput(color="#8A2BE2")  # Blue Violet
         result = self.tool.execute(input_data)
         
         # CSS formats should be properly formatted
@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+Test Legacy DevTools JSON Handling
+Tests that the legacy JSON formatter keeps the user's numbers as written
+"""
+
+import unittest
+import sys
+import os
+
+# Make the project root importable however this module is run (pytest also uses conftest.py)
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _ROOT not in sys.path:
+    sys.path.insert(0, _ROOT)
+
+
+class TestLegacyJSON(unittest.TestCase):
+    """Test cases for devtools_old JSON formatting"""
+
+    @classmethod
+    def setUpClass(cls):
+        """Set up test fixtures"""
+        import devtools_old
+        import jsonio
+        cls.devtools = devtools_old
+        cls.jsonio = jsonio
+
+    def test_formatter_keeps_nonfinite_and_exponents(self):
+        """Test NaN/Infinity and exponent spellings survive format and minify"""
+        text = '{"n":NaN,"i":-Infinity,"o":1e400,"e":1e-07,"b":1e+20}'
+        expected = {
+            False: '{\n  "n": NaN,\n  "i": -Infinity,\n  "o": Infinity,\n  "e": 1e-07,\n  "b": 1e+20\n}',
+            True: '{"n":NaN,"i":-Infinity,"o":Infinity,"e":1e-07,"b":1e+20}',
+        }
+        for minify, output in expected.items():
+            with self.subTest(minify=minify):
+                result = self.devtools.DevTools.json_formatter(text, minify=minify)
+                self.assertTrue(result["valid"])
+                self.assertEqual(result["output"], output)
+
+    def test_formatter_escapes_lone_surrogates(self):
+        """Test a lone surrogate escape is formatted without an encode error"""
+        text = '["\\ud800","\u00e9"]'
+        expected = {
+            False: '[\n  "\\ud800",\n  "\\u00e9"\n]',
+            True: '["\\ud800","\\u00e9"]',
+        }
+        for minify, output in expected.items():
+            with self.subTest(minify=minify):
+                result = self.devtools.DevTools.json_formatter(text, minify=minify)
+                self.assertEqual(result["output"], output)
+                # The CLI must be able to write the whole result as UTF-8
+                self.jsonio.dumpb(result)
+
+
+if __name__ == "__main__":
+    unittest.main()
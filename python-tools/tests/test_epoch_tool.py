@@ -7,21 +7,32 @@ Tests the epoch timestamp conversion functionality
 import unittest
 import sys
 import os
-import time
 from datetime import datetime, timezone
+from unittest.mock import patch
 
-# Add the parent directory to the path so we can import our modules
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+# Make the project root importable however this module is run (pytest also uses conftest.py)
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _ROOT not in sys.path:
+    sys.path.insert(0, _ROOT)
 
-from plugins.epoch_tool import EpochTool, EpochInput
+# Fixed "now" for tests that depend on the clock (2023-11-14 22:13:20 UTC)
+NOW = 1_700_000_000
+
+
+def frozen_clock():
+    """Freeze the epoch tool's clock at NOW"""
+    return patch("plugins.epoch_tool.time.time_ns", return_value=NOW * 1_000_000_000)
 
 
 class TestEpochTool(unittest.TestCase):
     """Test cases for Epoch tool"""
     
-    def setUp(self):
+    @classmethod
+    def setUpClass(cls):
         """Set up test fixtures"""
-        self.tool = EpochTool()
+        from plugins.epoch_tool import EpochTool, EpochInput
+        cls.tool = EpochTool()
+        cls.EpochInput = EpochInput
     
     def test_tool_config(self):
         """Test tool configuration"""
@@ -32,12 +43,12 @@ class TestEpochTool(unittest.TestCase):
     
     def test_current_time_conversion(self):
         """Test converting current time (no input)"""
-        input_data = EpochInput()  # No timestamp = current time
-        result = self.tool.execute(input_data)
+        input_data = self.EpochInput()  # No timestamp = current time
+        with frozen_clock():
+            result = self.tool.execute(input_data)
         
-        # Should be close to current time
-        current_epoch = int(time.time())
-        self.assertAlmostEqual(result.epoch, current_epoch, delta=2)  # Within 2 seconds
+        self.assertEqual(result.epoch, NOW)
+        self.assertEqual(result.relative["seconds"], 0)
         
         # Should have all format fields
         self.assertIn("readable", result.utc)
@@ -52,7 +63,7 @@ class TestEpochTool(unittest.TestCase):
         """Test converting specific timestamp"""
         # Jan 1, 2020 00:00:00 UTC
         test_epoch = "1577836800"
-        input_data = EpochInput(timestamp=test_epoch)
+        input_data = self.EpochInput(timestamp=test_epoch)
         result = self.tool.execute(input_data)
         
         self.assertEqual(result.epoch, 1577836800)
@@ -64,75 +75,82 @@ class TestEpochTool(unittest.TestCase):
         """Test converting millisecond timestamp"""
         # Millisecond timestamp (13+ digits)
         ms_timestamp = "1577836800000"  # Same as above but in ms
-        input_data = EpochInput(timestamp=ms_timestamp)
+        input_data = self.EpochInput(timestamp=ms_timestamp)
         result = self.tool.execute(input_data)
         
         self.assertEqual(result.epoch, 1577836800)  # Should convert ms to seconds
         self.assertIn("2020-01-01", result.utc["readable"])
-    
+
+    def test_utc_formats_repeated_epoch(self):
+        """Test the same instant gives equal UTC strings in fresh dicts"""
+        first = self.tool.execute(self.EpochInput(timestamp="1577836800"))
+        second = self.tool.execute(self.EpochInput(timestamp="1577836800000"))
+
+        self.assertEqual(first.utc, second.utc)
+        self.assertEqual(second.utc, {
+            "readable": "2020-01-01 00:00:00 UTC",
+            "iso": "2020-01-01T00:00:00+00:00",
+            "ddmmyyyy": "01/01/2020 00:00:00",
+        })
+        self.assertIsNot(first.utc, second.utc)
+
     def test_invalid_timestamp(self):
         """Test handling invalid timestamp"""
         with self.assertRaises(ValueError):
-            input_data = EpochInput(timestamp="not_a_number")
+            input_data = self.EpochInput(timestamp="not_a_number")
             self.tool.execute(input_data)
     
     def test_empty_timestamp(self):
         """Test handling empty timestamp"""
-        input_data = EpochInput(timestamp="")
-        result = self.tool.execute(input_data)
+        input_data = self.EpochInput(timestamp="")
+        with frozen_clock():
+            result = self.tool.execute(input_data)
         
         # Should use current time
-        current_epoch = int(time.time())
-        self.assertAlmostEqual(result.epoch, current_epoch, delta=2)
+        self.assertEqual(result.epoch, NOW)
     
     def test_relative_time_calculation(self):
         """Test relative time calculation"""
         # Use a timestamp from 1 day ago
-        one_day_ago = int(time.time()) - 86400  # 86400 seconds = 1 day
-        input_data = EpochInput(timestamp=str(one_day_ago))
-        result = self.tool.execute(input_data)
+        one_day_ago = NOW - 86400  # 86400 seconds = 1 day
+        input_data = self.EpochInput(timestamp=str(one_day_ago))
+        with frozen_clock():
+            result = self.tool.execute(input_data)
         
-        self.assertAlmostEqual(result.relative["days"], 1, delta=0.1)
-        self.assertAlmostEqual(result.relative["seconds"], 86400, delta=60)  # Within a minute
+        self.assertEqual(result.relative["days"], 1)
+        self.assertEqual(result.relative["seconds"], 86400)
         self.assertIn("ago", result.relative["human"])
     
     def test_future_timestamp(self):
         """Test future timestamp handling"""
         # Use a timestamp 1 hour in the future
-        one_hour_future = int(time.time()) + 3600  # 3600 seconds = 1 hour
-        input_data = EpochInput(timestamp=str(one_hour_future))
-        result = self.tool.execute(input_data)
+        one_hour_future = NOW + 3600  # 3600 seconds = 1 hour
+        input_data = self.EpochInput(timestamp=str(one_hour_future))
+        with frozen_clock():
+            result = self.tool.execute(input_data)
         
-        self.assertLess(result.relative["days"], 0)  # Negative days for future
-        self.assertLess(result.relative["seconds"], 0)  # Negative seconds for future
-        self.assertIn("from now", result.relative["human"])
+        self.assertEqual(result.relative["days"], -1)  # Days floor, like timedelta.days
+        self.assertEqual(result.relative["seconds"], -3600)
+        self.assertEqual(result.relative["human"], "1 hours from now")
     
     def test_various_time_formats(self):
         """Test various relative time format outputs"""
-        current_time = int(time.time())
-        
-        # Test seconds ago
-        seconds_ago = current_time - 30
-        input_data = EpochInput(timestamp=str(seconds_ago))
-        result = self.tool.execute(input_data)
-        self.assertIn("seconds ago", result.relative["human"])
-        
-        # Test minutes ago
-        minutes_ago = current_time - 300  # 5 minutes
-        input_data = EpochInput(timestamp=str(minutes_ago))
-        result = self.tool.execute(input_data)
-        self.assertIn("minutes ago", result.relative["human"])
-        
-        # Test hours ago
-        hours_ago = current_time - 7200  # 2 hours
-        input_data = EpochInput(timestamp=str(hours_ago))
-        result = self.tool.execute(input_data)
-        self.assertIn("hours ago", result.relative["human"])
+        cases = (
+            (30, "30 seconds ago"),
+            (300, "5 minutes ago"),
+            (7200, "2 hours ago"),
+        )
+        with frozen_clock():
+            for seconds_ago, expected in cases:
+                with self.subTest(seconds_ago=seconds_ago):
+                    input_data = self.EpochInput(timestamp=str(NOW - seconds_ago))
+                    result = self.tool.execute(input_data)
+                    self.assertEqual(result.relative["human"], expected)
     
     def test_timezone_handling(self):
         """Test timezone handling in output"""
         test_epoch = "1577836800"  # Jan 1, 2020 00:00:00 UTC
-        input_data = EpochInput(timestamp=test_epoch)
+        input_data = self.EpochInput(timestamp=test_epoch)
         result = self.tool.execute(input_data)
         
         # UTC should have UTC in readable format
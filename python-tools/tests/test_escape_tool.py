@@ -3,15 +3,17 @@ import unittest
 import sys
 import os
 
-# Add project path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+# Make the project root importable however this module is run (pytest also uses conftest.py)
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _ROOT not in sys.path:
+    sys.path.insert(0, _ROOT)
 
-from plugins.escape_tool import EscapeTool
 
- 
 class TestEscapeTool(unittest.TestCase):
-    def setUp(self):
-        self.tool = EscapeTool()
+    @classmethod
+    def setUpClass(cls):
+        from plugins.escape_tool import EscapeTool
+        cls.tool = EscapeTool()
 
     def test_escape_html(self):
         res = self.tool.run({"text": "a < b & c", "operation": "escape", "format": "html"})
@@ -25,6 +27,45 @@ class TestEscapeTool(unittest.TestCase):
         res = self.tool.run({"text": 'hello "world"', "operation": "escape", "format": "json"})
         self.assertIn('\\"', res["output_text"])  # contains escaped quotes
 
+    def test_escape_clean_text_unchanged(self):
+        for fmt in ("html", "json", "xml", "javascript"):
+            res = self.tool.run({"text": "plain text 123", "operation": "escape", "format": fmt})
+            self.assertEqual(res["output_text"], "plain text 123")
+
+    def test_escape_after_clean_prefix(self):
+        text = "clean prefix " * 20 + 'a "q" <b> & \x01 caf\u00e9'
+        expected = {
+            "html": "clean prefix " * 20 + 'a &quot;q&quot; &lt;b&gt; &amp; \x01 caf\u00e9',
+            "xml": "clean prefix " * 20 + 'a "q" &lt;b&gt; &amp; \x01 caf\u00e9',
+            "json": "clean prefix " * 20 + 'a \\"q\\" <b> & \\u0001 caf\u00e9',
+            "javascript": "clean prefix " * 20 + 'a \\"q\\" <b> & \\u0001 caf\\u00e9',
+        }
+        for fmt, out in expected.items():
+            res = self.tool.run({"text": text, "operation": "escape", "format": fmt})
+            self.assertEqual(res["output_text"], out)
+
+    def test_escape_control_chars(self):
+        # No quotes or backslashes, so only the control-character probe catches these
+        res = self.tool.run({"text": "a\tb\x01", "operation": "escape", "format": "json"})
+        self.assertEqual(res["output_text"], "a\\tb\\u0001")
+        res = self.tool.run({"text": "caf\u00e9", "operation": "escape", "format": "javascript"})
+        self.assertEqual(res["output_text"], "caf\\u00e9")
+        res = self.tool.run({"text": "a\x7fb\x01", "operation": "escape", "format": "javascript"})
+        self.assertEqual(res["output_text"], "a\x7fb\\u0001")
+
+    def test_escape_javascript_astral_roundtrip(self):
+        text = "x \U0001F600 \u4e16 'q'"
+        res = self.tool.run({"text": text, "operation": "escape", "format": "javascript"})
+        self.assertEqual(res["output_text"], "x \\ud83d\\ude00 \\u4e16 \\'q\\'")
+        res = self.tool.run({"text": res["output_text"], "operation": "unescape", "format": "javascript"})
+        self.assertEqual(res["output_text"], text)
+
+    def test_unescape_javascript_mixed_escapes(self):
+        # Pairs combine, lone surrogates and unknown escapes pass through, quotes stay literal
+        text = '\\ud83d\\ude00 \\ud800 \\q "x" \\x41\\u0042'
+        res = self.tool.run({"text": text, "operation": "unescape", "format": "javascript"})
+        self.assertEqual(res["output_text"], '\U0001F600 \ud800 \\q "x" AB')
+
 
 if __name__ == '__main__':
     unittest.main()
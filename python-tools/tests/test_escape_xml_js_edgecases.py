@@ -3,15 +3,17 @@ import unittest
 import sys
 import os
 
-# Add project path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
-
-from plugins.escape_tool import EscapeTool
+# Make the project root importable however this module is run (pytest also uses conftest.py)
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _ROOT not in sys.path:
+    sys.path.insert(0, _ROOT)
 
 
 class TestEscapeXmlAndJsEdgeCases(unittest.TestCase):
-    def setUp(self):
-        self.tool = EscapeTool()
+    @classmethod
+    def setUpClass(cls):
+        from plugins.escape_tool import EscapeTool
+        cls.tool = EscapeTool()
 
     def test_escape_xml_entities_and_unescape(self):
         text = "<tag attr=\"value & more\">A & B</tag>"
@@ -8,18 +8,30 @@ import unittest
 import sys
 import os
 
-# Add the parent directory to the path so we can import our modules
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
-
-from plugins.hash_tool import HashTool, HashInput
+# Make the project root importable however this module is run (pytest also uses conftest.py)
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _ROOT not in sys.path:
+    sys.path.insert(0, _ROOT)
 
 
 class TestHashTool(unittest.TestCase):
     """Test cases for Hash tool"""
     
-    def setUp(self):
+    # (algorithm, hex digest of "hello", digest length)
+    VECTORS = (
+        ("md5", "5d41402abc4b2a76b9719d911017c592", 32),
+        ("sha1", "aaf4c61ddcc5e8a2dabede0f3b482cd9aea9434d", 40),
+        ("sha256", "2cf24dba5fb0a30e26e83b2ac5b9e29e1b161e5c1fa7425e73043362938b9824", 64),
+        ("sha512", "9b71d224bd62f3785d96d46ad3ea3d73319bfbc2890caadae2dff72519673ca7"
+                   "2323c3d99ba5c11d7c7acc6e14b8c5da0c4663475c2e5c3adef46f73bcdec043", 128),
+    )
+    
+    @classmethod
+    def setUpClass(cls):
         """Set up test fixtures"""
-        self.tool = HashTool()
+        from plugins.hash_tool import HashTool, HashInput
+        cls.tool = HashTool()
+        cls.HashInput = HashInput
     
     def test_tool_config(self):
         """Test tool configuration"""
@@ -28,56 +40,29 @@ class TestHashTool(unittest.TestCase):
         self.assertEqual(config.category, "security")
         self.assertIn("hash", config.keywords)
     
-    def test_md5_hash(self):
-        """Test MD5 hash generation"""
-        input_data = HashInput(text="hello", algorithm="md5")
-        result = self.tool.execute(input_data)
-        
-        self.assertEqual(result.hash, "5d41402abc4b2a76b9719d911017c592")
-        self.assertEqual(result.algorithm, "md5")
-        self.assertEqual(result.length, 32)
-    
-    def test_sha1_hash(self):
-        """Test SHA1 hash generation"""
-        input_data = HashInput(text="hello", algorithm="sha1")
-        result = self.tool.execute(input_data)
-        
-        self.assertEqual(result.hash, "aaf4c61ddcc5e8a2dabede0f3b482cd9aea9434d")
-        self.assertEqual(result.algorithm, "sha1")
-        self.assertEqual(result.length, 40)
-    
-    def test_sha256_hash(self):
-        """Test SHA256 hash generation"""
-        input_data = HashInput(text="hello", algorithm="sha256")
-        result = self.tool.execute(input_data)
-        
-        self.assertEqual(result.hash, "2cf24dba5fb0a30e26e83b2ac5b9e29e1b161e5c1fa7425e73043362938b9824")
-        self.assertEqual(result.algorithm, "sha256")
-        self.assertEqual(result.length, 64)
-    
-    def test_sha512_hash(self):
-        """Test SHA512 hash generation"""
-        input_data = HashInput(text="hello", algorithm="sha512")
-        result = self.tool.execute(input_data)
-        
-        expected = "9b71d224bd62f3785d96d46ad3ea3d73319bfbc2890caadae2dff72519673ca72323c3d99ba5c11d7c7acc6e14b8c5da0c4663475c2e5c3adef46f73bcdec043"
-        self.assertEqual(result.hash, expected)
-        self.assertEqual(result.algorithm, "sha512")
-        self.assertEqual(result.length, 128)
+    def test_all_algorithms(self):
+        """Test hash generation for every algorithm against known vectors"""
+        for algorithm, expected, length in self.VECTORS:
+            with self.subTest(algorithm=algorithm):
+                result = self.tool.execute(self.HashInput(text="hello", algorithm=algorithm))
+                
+                self.assertEqual(result.hash, expected)
+                self.assertEqual(result.algorithm, algorithm)
+                self.assertEqual(result.length, length)
     
     def test_empty_text(self):
         """Test handling empty text"""
         with self.assertRaises(Exception):
-            HashInput(text="", algorithm="sha256")
+            self.HashInput(text="", algorithm="sha256")
     
     def test_invalid_algorithm(self):
         """Test handling invalid algorithm"""
         with self.assertRaises(Exception):
-            HashInput(text="test", algorithm="invalid")
+            self.HashInput(text="test", algorithm="invalid")
     
     def test_unicode_text(self):
         """Test hashing Unicode text"""
-        input_data = HashInput(text="Hello 世界! 🌍", algorithm="sha256")
+        input_data = self.HashInput(text="Hello 世界! 🌍", algorithm="sha256")
         result = self.tool.execute(input_data)
         
         self.assertEqual(len(result.hash), 64)  # SHA256 is always 64 chars
@@ -86,7 +71,7 @@ class TestHashTool(unittest.TestCase):
     def test_large_text(self):
         """Test hashing large text"""
         large_text = "A" * 10000  # 10k characters
-        input_data = HashInput(text=large_text, algorithm="sha256")
+        input_data = self.HashInput(text=large_text, algorithm="sha256")
         result = self.tool.execute(input_data)
         
         self.assertEqual(len(result.hash), 64)
@@ -96,14 +81,42 @@ class TestHashTool(unittest.TestCase):
         """Test that same input produces same hash"""
         text = "consistency test"
         
-        input1 = HashInput(text=text, algorithm="sha256")
+        input1 = self.HashInput(text=text, algorithm="sha256")
         result1 = self.tool.execute(input1)
         
-        input2 = HashInput(text=text, algorithm="sha256")
+        input2 = self.HashInput(text=text, algorithm="sha256")
         result2 = self.tool.execute(input2)
         
         self.assertEqual(result1.hash, result2.hash)
     
+    def test_bytes_input(self):
+        """Test UTF-8 bytes hash the same as the equivalent text"""
+        text = "héllo wörld"
+        expected = self.tool.execute(self.HashInput(text=text)).hash
+        result = self.tool.execute(self.HashInput(text=text.encode('utf-8')))
+        self.assertEqual(result.hash, expected)
+        self.assertEqual(result.input, text.encode('utf-8'))
+        
+        with self.assertRaises(Exception):
+            self.HashInput(text=b"   ")
+    
+    def test_execute_many(self):
+        """Test batch hashing matches single hashing, in order"""
+        small = ["a", "b", "c"]
+        large = [("text %d " % i) * 1000 for i in range(16)]  # takes the threaded path
+        
+        for texts in (small, large):
+            expected = [self.tool.execute(self.HashInput(text=t, algorithm="md5")).hash for t in texts]
+            results = self.tool.execute_many(texts, algorithm="md5")
+            self.assertEqual([r.hash for r in results], expected)
+    
+    def test_execute_many_validates_inputs(self):
+        """Test batch hashing rejects invalid texts and algorithms"""
+        with self.assertRaises(Exception):
+            self.tool.execute_many(["ok", ""])
+        with self.assertRaises(Exception):
+            self.tool.execute_many(["ok"], algorithm="invalid")
+    
     def test_get_schemas(self):
         """Test schema generation"""
         input_schema = self.tool.get_input_schema()
@@ -9,20 +9,23 @@ import sys
 import os
 import json
 
-# Add the parent directory to the path so we can import our modules
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
-
-from plugins.json_tool import JSONTool, JSONInput
+# Make the project root importable however this module is run (pytest also uses conftest.py)
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _ROOT not in sys.path:
+    sys.path.insert(0, _ROOT)
 
 
 class TestJSONTool(unittest.TestCase):
     """Test cases for JSON tool"""
     
-    def setUp(self):
+    @classmethod
+    def setUpClass(cls):
         """Set up test fixtures"""
-        self.tool = JSONTool()
-        self.sample_json = '{"name":"John","age":30,"city":"New York"}'
-        self.sample_formatted = '''{
+        from plugins.json_tool import JSONTool, JSONInput
+        cls.tool = JSONTool()
+        cls.JSONInput = JSONInput
+        cls.sample_json = '{"name":"John","age":30,"city":"New York"}'
+        cls.sample_formatted = '''{
   "age": 30,
   "city": "New York",
   "name": "John"
@@ -37,7 +40,7 @@ class TestJSONTool(unittest.TestCase):
     
     def test_json_formatting(self):
         """Test JSON formatting"""
-        input_data = JSONInput(text=self.sample_json, minify=False)
+        input_data = self.JSONInput(text=self.sample_json, minify=False)
         result = self.tool.execute(input_data)
         
         self.assertEqual(result.operation, "format")
@@ -56,7 +59,7 @@ class TestJSONTool(unittest.TestCase):
   "age": 30,
   "city": "New York"
 }'''
-        input_data = JSONInput(text=formatted_json, minify=True)
+        input_data = self.JSONInput(text=formatted_json, minify=True)
         result = self.tool.execute(input_data)
         
         self.assertEqual(result.operation, "minify")
@@ -76,7 +79,7 @@ class TestJSONTool(unittest.TestCase):
         obj = {"spellcheck_results_one": complex_value}
         input_text = json.dumps(obj, ensure_ascii=False)
 
-        input_data = JSONInput(text=input_text, minify=True)
+        input_data = self.JSONInput(text=input_text, minify=True)
         result = self.tool.execute(input_data)
 
         self.assertEqual(result.operation, "minify")
@@ -89,15 +92,31 @@ class TestJSONTool(unittest.TestCase):
     def test_invalid_json(self):
         """Test handling invalid JSON"""
         invalid_json = '{"name":"John","age":30,}'  # Trailing comma
-        input_data = JSONInput(text=invalid_json)
+        input_data = self.JSONInput(text=invalid_json)
         
         with self.assertRaises(ValueError):
             self.tool.execute(input_data)
     
+    def test_auto_unescape_html_encoded_json(self):
+        """Test HTML-encoded JSON is unescaped and parsed, unless disabled"""
+        encoded = '{&quot;name&quot;:&quot;Tom &amp; Jerry&quot;}'
+        result = self.tool.execute(self.JSONInput(text=encoded, minify=True))
+        self.assertEqual(result.parsed_data, {"name": "Tom & Jerry"})
+        self.assertEqual(result.original, '{"name":"Tom & Jerry"}')
+        
+        with self.assertRaises(ValueError):
+            self.tool.execute(self.JSONInput(text=encoded, auto_unescape=False))
+    
+    def test_non_object_root_rejected(self):
+        """Test top-level arrays and scalars are rejected (parsed_data is an object)"""
+        for text in ('[1, 2]', '"x"', '42'):
+            with self.assertRaises(ValueError):
+                self.tool.execute(self.JSONInput(text=text))
+    
     def test_complex_json(self):
         """Test formatting complex JSON"""
         complex_json = '{"users":[{"name":"John","details":{"age":30,"skills":["python","javascript"]}}],"meta":{"version":"1.0"}}'
-        input_data = JSONInput(text=complex_json, minify=False)
+        input_data = self.JSONInput(text=complex_json, minify=False)
         result = self.tool.execute(input_data)
         
         self.assertTrue(result.valid)
@@ -112,11 +131,11 @@ class TestJSONTool(unittest.TestCase):
     def test_empty_json(self):
         """Test handling empty JSON"""
         with self.assertRaises(Exception):
-            JSONInput(text="")
+            self.JSONInput(text="")
     
     def test_size_calculation(self):
         """Test size before/after calculation"""
-        input_data = JSONInput(text=self.sample_json, minify=False)
+        input_data = self.JSONInput(text=self.sample_json, minify=False)
         result = self.tool.execute(input_data)
         
         self.assertEqual(result.size_before, len(self.sample_json))
@@ -126,7 +145,7 @@ class TestJSONTool(unittest.TestCase):
     def test_unicode_json(self):
         """Test JSON with Unicode characters"""
         unicode_json = '{"message":"Hello 世界! 🌍","emoji":"🎉"}'
-        input_data = JSONInput(text=unicode_json, minify=False)
+        input_data = self.JSONInput(text=unicode_json, minify=False)
         result = self.tool.execute(input_data)
         
         self.assertTrue(result.valid)
@@ -140,11 +159,11 @@ class TestJSONTool(unittest.TestCase):
     def test_roundtrip_format_minify(self):
         """Test formatting then minifying returns compact JSON"""
         # Format first
-        format_input = JSONInput(text=self.sample_json, minify=False)
+        format_input = self.JSONInput(text=self.sample_json, minify=False)
         format_result = self.tool.execute(format_input)
         
         # Then minify
-        minify_input = JSONInput(text=format_result.formatted, minify=True)
+        minify_input = self.JSONInput(text=format_result.formatted, minify=True)
         minify_result = self.tool.execute(minify_input)
         
         # Should be valid and compact
@@ -153,6 +172,15 @@ class TestJSONTool(unittest.TestCase):
         parsed_final = json.loads(minify_result.formatted)
         self.assertEqual(parsed_original, parsed_final)
     
+    def test_wide_integers_and_constants_preserved(self):
+        """Test integers wider than 64 bits and NaN survive format and minify"""
+        for minify in (False, True):
+            result = self.tool.execute(self.JSONInput(text='{"big": 123456789012345678901234567890}', minify=minify))
+            self.assertIn("123456789012345678901234567890", result.formatted)
+            
+            result = self.tool.execute(self.JSONInput(text='{"n": NaN}', minify=minify))
+            self.assertIn("NaN", result.formatted)
+    
     def test_get_schemas(self):
         """Test schema generation"""
         input_schema = self.tool.get_input_schema()
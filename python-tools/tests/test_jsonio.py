@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""
+Test JSON Output Helpers
+Tests the serializer shared by the devtools.py and devtools_old.py CLIs
+"""
+
+import unittest
+import sys
+import os
+
+# Make the project root importable however this module is run (pytest also uses conftest.py)
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _ROOT not in sys.path:
+    sys.path.insert(0, _ROOT)
+
+
+class TestJSONOutput(unittest.TestCase):
+    """Test cases for jsonio serialization"""
+
+    @classmethod
+    def setUpClass(cls):
+        """Set up test fixtures"""
+        import jsonio
+        cls.jsonio = jsonio
+
+    def test_nonfinite_values_kept(self):
+        """Test NaN/Infinity are written, not nulled, with any backend"""
+        data = {"payload": {"exp": float("inf"), "ratio": float("nan")}, "note": None}
+        self.assertEqual(
+            self.jsonio.dumps(data, pretty=False),
+            '{"payload":{"exp":Infinity,"ratio":NaN},"note":null}'
+        )
+
+    def test_finite_output_unchanged(self):
+        """Test ordinary results serialize the same with any backend"""
+        data = {"name": "café", "n": 1, "ok": True, "none": None, "items": [1.5, "x"]}
+        self.assertEqual(
+            self.jsonio.dumps(data, pretty=False),
+            '{"name":"café","n":1,"ok":true,"none":null,"items":[1.5,"x"]}'
+        )
+        self.assertEqual(
+            self.jsonio.dumpb({"name": "café", "items": [1, "x"]}),
+            '{\n  "name": "café",\n  "items": [\n    1,\n    "x"\n  ]\n}'.encode("utf-8")
+        )
+
+    def test_lone_surrogates_escaped(self):
+        """Test text with no UTF-8 form is written with ASCII escapes"""
+        self.assertEqual(self.jsonio.dumpb(["\ud800", "é"], pretty=False), b'["\\ud800","\\u00e9"]')
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Test Tool Registry
+Tests automatic plugin registration and registry lookups
+"""
+
+import unittest
+import sys
+import os
+from typing import Type
+
+# Make the project root importable however this module is run (pytest also uses conftest.py)
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _ROOT not in sys.path:
+    sys.path.insert(0, _ROOT)
+
+from core.base import BaseTool, ToolInput, ToolOutput, ToolConfig, registry
+import plugins
+
+
+class TestToolRegistry(unittest.TestCase):
+    """Test cases for the tool registry"""
+    
+    def tearDown(self):
+        """Drop tools registered by the tests"""
+        for name in ("registry_probe", "registryprobe"):
+            registry._tools.pop(name, None)
+            registry._instances.pop(name, None)
+            for category, names in list(registry._by_category.items()):
+                if name in names:
+                    names.remove(name)
+                    if not names:
+                        del registry._by_category[category]
+        registry._list_cache = None
+    
+    def test_bundled_tools_registered(self):
+        """Test every bundled plugin registers itself on import"""
+        plugins.load_all()
+        for name in ("base64", "url", "hash", "jwt", "json", "uuid", "epoch", "color", "escape"):
+            self.assertIn(name, registry.list_tools())
+    
+    def test_tool_instances_and_schemas_cached(self):
+        """Test get_tool reuses instances and schemas are generated once"""
+        plugins.load_plugin("hash")
+        tool = registry.get_tool("hash")
+        self.assertIs(registry.get_tool("hash"), tool)
+        self.assertIs(tool.get_input_schema(), tool.get_input_schema())
+        self.assertIs(tool.get_output_schema(), tool.get_output_schema())
+    
+    def test_category_lookup(self):
+        """Test category queries use the configs captured at registration"""
+        plugins.load_all()
+        self.assertIn("encoding", registry.get_all_categories())
+        self.assertIn("base64", registry.get_tools_by_category("encoding"))
+        self.assertNotIn("uuid", registry.get_tools_by_category("encoding"))
+        self.assertEqual(registry.get_tools_by_category("no-such-category"), [])
+    
+    def test_snapshot_cached_until_registration(self):
+        """Test snapshot() is reused and rebuilt after a new tool registers"""
+        plugins.load_all()
+        snapshot = registry.snapshot()
+        self.assertIs(registry.snapshot(), snapshot)
+        self.assertEqual(snapshot["total_tools"], len(registry.list_tools()))
+        
+        class ProbeTool(BaseTool, tool_name="registry_probe"):
+            def get_config(self) -> ToolConfig:
+                return ToolConfig(name="registry_probe", description="probe", category="test")
+            
+            def get_input_model(self) -> Type[ToolInput]:
+                return ToolInput
+            
+            def get_output_model(self) -> Type[ToolOutput]:
+                return ToolOutput
+            
+            def execute(self, input_data: ToolInput) -> ToolOutput:
+                return ToolOutput()
+        
+        self.assertIsNot(registry.snapshot(), snapshot)
+        self.assertEqual(registry.snapshot()["tools_by_category"]["test"], ["registry_probe"])
+    
+    def test_subclass_auto_registers(self):
+        """Test defining a concrete subclass registers it under tool_name"""
+        class ProbeTool(BaseTool, tool_name="registry_probe"):
+            def get_config(self) -> ToolConfig:
+                return ToolConfig(name="registry_probe", description="probe", category="test")
+            
+            def get_input_model(self) -> Type[ToolInput]:
+                return ToolInput
+            
+            def get_output_model(self) -> Type[ToolOutput]:
+                return ToolOutput
+            
+            def execute(self, input_data: ToolInput) -> ToolOutput:
+                return ToolOutput()
+        
+        self.assertIsInstance(registry.get_tool("registry_probe"), ProbeTool)
+        self.assertEqual(registry.get_tools_by_category("test"), ["registry_probe"])
+    
+    def test_abstract_and_opted_out_subclasses_skipped(self):
+        """Test abstract bases and _auto_register = False are not registered"""
+        before = set(registry.list_tools())
+        
+        class RegistryProbeTool(BaseTool):
+            _auto_register = False
+            
+            def get_config(self) -> ToolConfig:
+                return ToolConfig(name="registryprobe", description="probe", category="test")
+            
+            def get_input_model(self) -> Type[ToolInput]:
+                return ToolInput
+            
+            def get_output_model(self) -> Type[ToolOutput]:
+                return ToolOutput
+            
+            def execute(self, input_data: ToolInput) -> ToolOutput:
+                return ToolOutput()
+        
+        class PartialTool(BaseTool):
+            def get_config(self) -> ToolConfig:
+                return ToolConfig(name="partial", description="probe", category="test")
+        
+        self.assertEqual(set(registry.list_tools()), before)
+
+
+if __name__ == "__main__":
+    unittest.main()
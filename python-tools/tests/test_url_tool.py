@@ -8,18 +8,21 @@ import unittest
 import sys
 import os
 
-# Add the parent directory to the path so we can import our modules
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
-
-from plugins.url_tool import UrlTool, UrlInput
+# Make the project root importable however this module is run (pytest also uses conftest.py)
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _ROOT not in sys.path:
+    sys.path.insert(0, _ROOT)
 
 
 class TestUrlTool(unittest.TestCase):
     """Test cases for URL tool"""
     
-    def setUp(self):
+    @classmethod
+    def setUpClass(cls):
         """Set up test fixtures"""
-        self.tool = UrlTool()
+        from plugins.url_tool import UrlTool, UrlInput
+        cls.tool = UrlTool()
+        cls.UrlInput = UrlInput
     
     def test_tool_config(self):
         """Test tool configuration"""
@@ -30,7 +33,7 @@ class TestUrlTool(unittest.TestCase):
     
     def test_url_encoding(self):
         """Test URL encoding"""
-        input_data = UrlInput(text="Hello World!", operation="encode")
+        input_data = self.UrlInput(text="Hello World!", operation="encode")
         result = self.tool.execute(input_data)
         
         self.assertEqual(result.output, "Hello%20World%21")
@@ -38,7 +41,7 @@ class TestUrlTool(unittest.TestCase):
     
     def test_url_decoding(self):
         """Test URL decoding"""
-        input_data = UrlInput(text="Hello%20World%21", operation="decode")
+        input_data = self.UrlInput(text="Hello%20World%21", operation="decode")
         result = self.tool.execute(input_data)
         
         self.assertEqual(result.output, "Hello World!")
@@ -47,7 +50,7 @@ class TestUrlTool(unittest.TestCase):
     def test_url_encoding_special_chars(self):
         """Test URL encoding with special characters"""
         special_text = "user@example.com/path?query=value&other=123"
-        input_data = UrlInput(text=special_text, operation="encode")
+        input_data = self.UrlInput(text=special_text, operation="encode")
         result = self.tool.execute(input_data)
         
         self.assertIn("user%40example.com", result.output)
@@ -60,11 +63,11 @@ class TestUrlTool(unittest.TestCase):
         original_text = "Hello World! @#$%^&*()"
         
         # Encode
-        encode_input = UrlInput(text=original_text, operation="encode")
+        encode_input = self.UrlInput(text=original_text, operation="encode")
         encode_result = self.tool.execute(encode_input)
         
         # Decode
-        decode_input = UrlInput(text=encode_result.output, operation="decode")
+        decode_input = self.UrlInput(text=encode_result.output, operation="decode")
         decode_result = self.tool.execute(decode_input)
         
         self.assertEqual(decode_result.output, original_text)
@@ -72,17 +75,22 @@ class TestUrlTool(unittest.TestCase):
     def test_empty_text(self):
         """Test handling empty text"""
         with self.assertRaises(Exception):
-            UrlInput(text="", operation="encode")
+            self.UrlInput(text="", operation="encode")
     
     def test_invalid_operation(self):
         """Test handling invalid operation"""
         with self.assertRaises(Exception):
-            UrlInput(text="test", operation="invalid")  # type: ignore[arg-type]
+            self.UrlInput(text="test", operation="invalid")  # type: ignore[arg-type]
+    
+    def test_decode_requires_encoded_text(self):
+        """Test decoding text without any % escapes is rejected"""
+        with self.assertRaises(Exception):
+            self.UrlInput(text="plain text", operation="decode")
     
     def test_unicode_handling(self):
         """Test Unicode character handling"""
         unicode_text = "Hello 世界! 🌍"
-        input_data = UrlInput(text=unicode_text, operation="encode")
+        input_data = self.UrlInput(text=unicode_text, operation="encode")
         result = self.tool.execute(input_data)
         
         # Should encode Unicode characters
@@ -90,10 +98,23 @@ class TestUrlTool(unittest.TestCase):
         self.assertIn("%", result.output)
         
         # Decode back
-        decode_input = UrlInput(text=result.output, operation="decode")
+        decode_input = self.UrlInput(text=result.output, operation="decode")
         decode_result = self.tool.execute(decode_input)
         self.assertEqual(decode_result.output, unicode_text)
     
+    def test_encoding_matches_stdlib_quote(self):
+        """Test encoding agrees with urllib.parse.quote for every character class"""
+        from urllib.parse import quote
+        texts = [
+            "".join(map(chr, range(1, 128))),  # Every ASCII character
+            "plain/path-segment_1.2~",         # Nothing to escape
+            "héllo wörld 世界 🌍",             # Multi-byte UTF-8
+        ]
+        for text in texts:
+            with self.subTest(text=text):
+                result = self.tool.execute(self.UrlInput(text=text, operation="encode"))
+                self.assertEqual(result.output, quote(text))
+
     def test_get_schemas(self):
         """Test schema generation"""
         input_schema = self.tool.get_input_schema()
@@ -10,19 +10,22 @@ import os
 import uuid
 import re
 
-# Add the parent directory to the path so we can import our modules
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
-
-from plugins.uuid_tool import UUIDTool, UUIDInput
+# Make the project root importable however this module is run (pytest also uses conftest.py)
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _ROOT not in sys.path:
+    sys.path.insert(0, _ROOT)
 
 
 class TestUUIDTool(unittest.TestCase):
     """Test cases for UUID tool"""
     
-    def setUp(self):
+    @classmethod
+    def setUpClass(cls):
         """Set up test fixtures"""
-        self.tool = UUIDTool()
-        self.uuid_pattern = re.compile(r'^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$', re.IGNORECASE)
+        from plugins.uuid_tool import UUIDTool, UUIDInput
+        cls.tool = UUIDTool()
+        cls.UUIDInput = UUIDInput
+        cls.uuid_pattern = re.compile(r'^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$', re.IGNORECASE)
     
     def test_tool_config(self):
         """Test tool configuration"""
@@ -33,7 +36,7 @@ class TestUUIDTool(unittest.TestCase):
     
     def test_uuid_v4_generation(self):
         """Test UUID v4 generation"""
-        input_data = UUIDInput(version=4, count=1)
+        input_data = self.UUIDInput(version=4, count=1)
         result = self.tool.execute(input_data)
         
         self.assertEqual(result.version, 4)
@@ -49,7 +52,7 @@ class TestUUIDTool(unittest.TestCase):
     
     def test_uuid_v1_generation(self):
         """Test UUID v1 generation"""
-        input_data = UUIDInput(version=1, count=1)
+        input_data = self.UUIDInput(version=1, count=1)
         result = self.tool.execute(input_data)
         
         self.assertEqual(result.version, 1)
@@ -65,7 +68,7 @@ class TestUUIDTool(unittest.TestCase):
     
     def test_multiple_uuid_generation(self):
         """Test generating multiple UUIDs"""
-        input_data = UUIDInput(version=4, count=5)
+        input_data = self.UUIDInput(version=4, count=5)
         result = self.tool.execute(input_data)
         
         self.assertEqual(result.count, 5)
@@ -82,19 +85,19 @@ class TestUUIDTool(unittest.TestCase):
     def test_invalid_version(self):
         """Test handling invalid UUID version"""
         with self.assertRaises(Exception):
-            UUIDInput(version=3, count=1)  # Only 1 and 4 supported
+            self.UUIDInput(version=3, count=1)  # Only 1 and 4 supported
     
     def test_invalid_count(self):
         """Test handling invalid count"""
         with self.assertRaises(Exception):
-            UUIDInput(version=4, count=0)  # Must be positive
+            self.UUIDInput(version=4, count=0)  # Must be positive
         
         with self.assertRaises(Exception):
-            UUIDInput(version=4, count=101)  # Too many
+            self.UUIDInput(version=4, count=101)  # Too many
     
     def test_default_values(self):
         """Test default input values"""
-        input_data = UUIDInput()  # Should use defaults
+        input_data = self.UUIDInput()  # Should use defaults
         result = self.tool.execute(input_data)
         
         self.assertEqual(result.version, 4)  # Default version
@@ -103,7 +106,7 @@ class TestUUIDTool(unittest.TestCase):
     
     def test_uuid_format_consistency(self):
         """Test UUID format is consistent"""
-        input_data = UUIDInput(version=4, count=10)
+        input_data = self.UUIDInput(version=4, count=10)
         result = self.tool.execute(input_data)
         
         for generated_uuid in result.uuids:
@@ -119,7 +122,7 @@ class TestUUIDTool(unittest.TestCase):
     
     def test_uuid_parsability(self):
         """Test generated UUIDs can be parsed by Python's uuid module"""
-        input_data = UUIDInput(version=4, count=3)
+        input_data = self.UUIDInput(version=4, count=3)
         result = self.tool.execute(input_data)
         
         for generated_uuid in result.uuids:
@@ -128,6 +131,15 @@ class TestUUIDTool(unittest.TestCase):
             self.assertEqual(str(parsed_uuid), generated_uuid)
             self.assertEqual(parsed_uuid.version, 4)
     
+    def test_uuid_v4_variant(self):
+        """Test batch-generated v4 UUIDs carry the RFC 4122 variant bits"""
+        input_data = self.UUIDInput(version=4, count=100)
+        result = self.tool.execute(input_data)
+        
+        for generated_uuid in result.uuids:
+            self.assertEqual(uuid.UUID(generated_uuid).variant, uuid.RFC_4122)
+        self.assertEqual(len(set(result.uuids)), 100)
+    
     def test_get_schemas(self):
         """Test schema generation"""
         input_schema = self.tool.get_input_schema()
@@ -6,7 +6,8 @@ Usage: python3 scripts/update_vscode_venv.py
 
 This script will:
  - verify python-tools/.venv exists
- - query the venv for sys.executable and site-packages path
+ - read the interpreter and site-packages paths from the venv's pyvenv.cfg
+   (querying the venv python only if that isn't enough)
  - update (or create) .vscode/settings.json with the interpreter path and
    add the site-packages path and ${workspaceFolder}/python-tools to
    python.analysis.extraPaths so Pylance can resolve installed packages.
@@ -27,10 +28,44 @@ def fail(msg: str, code: int = 1):
     sys.exit(code)
 
 
+def venv_info_from_cfg(venv_python: Path):
+    """Derive the venv paths from pyvenv.cfg, without starting the interpreter.
+
+    Returns None when pyvenv.cfg has no usable version or the derived
+    site-packages directory doesn't exist.
+    """
+    venv_dir = venv_python.parent.parent
+    try:
+        cfg = (venv_dir / "pyvenv.cfg").read_text(encoding="utf8")
+    except OSError:
+        return None
+
+    # venv writes "version = 3.12.1", virtualenv "version_info = 3.12.1.final.0"
+    values = {}
+    for line in cfg.splitlines():
+        key, sep, value = line.partition("=")
+        if sep:
+            values[key.strip()] = value.strip()
+    version = values.get("version") or values.get("version_info")
+    if not version:
+        return None
+
+    major_minor = ".".join(version.split(".")[:2])
+    site = venv_dir / "lib" / f"python{major_minor}" / "site-packages"
+    if not site.is_dir():
+        return None
+    return {"exe": str(venv_python), "site": str(site)}
+
+
 def get_venv_info(venv_python: Path):
     if not venv_python.exists():
         fail(f"Virtualenv python not found at {venv_python}. Create it first (./python-tools/run.sh)")
 
+    info = venv_info_from_cfg(venv_python)
+    if info is not None:
+        return info
+
+    # No usable pyvenv.cfg: ask the interpreter itself
     cmd = [str(venv_python), "-c", (
         'import sys, json, sysconfig; ' 
         'p=sysconfig.get_paths().get("purelib") or sys.prefix; ' 
@@ -56,9 +91,11 @@ def load_settings(path: Path):
     try:
         # settings.json may contain comments (jsonc). Attempt a tolerant load.
         txt = path.read_text(encoding="utf8")
-        # strip simple C-style comments (very small heuristic)
-        import re
-        txt_no_comments = re.sub(r"(?m)^\s*//.*\n?", "", txt)
+        # strip whole-line // comments (very small heuristic); split on "\n"
+        # only, so other line separators inside string values are left alone
+        txt_no_comments = "\n".join(
+            line for line in txt.split("\n") if not line.lstrip().startswith("//")
+        )
         return json.loads(txt_no_comments)
     except Exception:
         # fall back to empty